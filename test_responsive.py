@@ -24,7 +24,7 @@ def test_theme_responsiveness():
         print(f"Switch {i+1}: {new_theme} theme")
         print(f"  - Style length: {style_length} chars")
         print(f"  - Ready color: {status_colors['ready'][:30]}...")
-        print(f"  - Manager state: {theme_manager.current_theme}")
+        print(f"  - Manager state: {theme_manager.get_current_theme()}")
         print()
     
     print("✅ All theme switches completed successfully!")
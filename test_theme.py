@@ -15,7 +15,7 @@ def test_theme_switching():
     
     # Test initial state
     print(f"Initial theme: {get_current_theme()}")
-    print(f"Theme manager state: {theme_manager.current_theme}")
+    print(f"Theme manager state: {theme_manager.get_current_theme()}")
     
     # Test theme toggle
     print("\n🔄 Testing theme toggle...")
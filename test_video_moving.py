@@ -8,9 +8,14 @@ import numpy as np
 import sys
 import time
 import tempfile
-import os
+from pathlib import Path
 sys.path.append('.')
 
+from logo_detector import detect_logos_automatically
+
+# Computed once; every test video uses the same codec
+MP4V_FOURCC = cv2.VideoWriter_fourcc(*'mp4v')
+
 def create_test_video_with_moving_watermark():
     """Create a test video with a moving watermark"""
     print("🎬 Creating test video with moving watermark...")
@@ -25,8 +30,7 @@ def create_test_video_with_moving_watermark():
     temp_video.close()
     
     # Create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(temp_video.name, fourcc, fps, (width, height))
+    out = cv2.VideoWriter(temp_video.name, MP4V_FOURCC, fps, (width, height))
     
     # Watermark positions (moving from top-left to bottom-right)
     positions = [
@@ -37,28 +41,29 @@ def create_test_video_with_moving_watermark():
         (1000, 650),   # Frame 5: bottom-right
     ]
     
-    for frame_num, (wx, wy) in enumerate(positions):
-        # Create frame
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-        frame[:] = (30, 30, 30)  # Dark background
-        
-        # Add main content
-        cv2.rectangle(frame, (100, 100), (1180, 620), (50, 50, 100), -1)
-        cv2.putText(frame, f"VIDEO FRAME {frame_num + 1}", (400, 350), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255, 255, 255), 3)
-        
-        # Add moving watermark
-        cv2.putText(frame, "www.testsite.com", (wx, wy), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
-        
-        # Add another static watermark for comparison
-        cv2.putText(frame, "HD QUALITY", (1100, 50), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (180, 180, 180), 2)
-        
-        # Write frame
-        out.write(frame)
-    
-    out.release()
+    try:
+        for frame_num, (wx, wy) in enumerate(positions):
+            # Create frame
+            frame = np.zeros((height, width, 3), dtype=np.uint8)
+            frame[:] = (30, 30, 30)  # Dark background
+        
+            # Add main content
+            cv2.rectangle(frame, (100, 100), (1180, 620), (50, 50, 100), -1)
+            cv2.putText(frame, f"VIDEO FRAME {frame_num + 1}", (400, 350), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255, 255, 255), 3)
+        
+            # Add moving watermark
+            cv2.putText(frame, "www.testsite.com", (wx, wy), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.8, (200, 200, 200), 2)
+        
+            # Add another static watermark for comparison
+            cv2.putText(frame, "HD QUALITY", (1100, 50), 
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (180, 180, 180), 2)
+        
+            # Write frame
+            out.write(frame)
+    finally:
+        out.release()
     print(f"✅ Test video created: {temp_video.name}")
     return temp_video.name
 
@@ -71,8 +76,6 @@ def test_moving_watermark_detection():
     try:
         print(f"\n🔍 Testing moving watermark detection...")
         
-        from logo_detector import detect_logos_automatically
-        
         # Test the enhanced detection
         start_time = time.time()
         result = detect_logos_automatically(video_path, '/opt/homebrew/bin/ffmpeg')
@@ -82,34 +85,37 @@ def test_moving_watermark_detection():
         print(f"  ⏱️  Detection time: {detection_time:.2f}s")
         print(f"  🎯 Total detections: {len(result)}")
         
-        # Analyze results
-        watermarks = [r for r in result if r.get('is_watermark', False)]
-        text_detections = [r for r in result if r.get('text', '').strip()]
-        
-        print(f"  💧 Watermarks found: {len(watermarks)}")
-        print(f"  📝 Text detections: {len(text_detections)}")
+        # Analyze results in a single pass
+        watermark_count = 0
+        text_count = 0
+        has_moving_detection = False
+        for det in result:
+            if det.get('is_watermark', False):
+                watermark_count += 1
+            if det.get('text', '').strip():
+                text_count += 1
+            if det.get('multi_frame', False):
+                has_moving_detection = True
+        
+        print(f"  💧 Watermarks found: {watermark_count}")
+        print(f"  📝 Text detections: {text_count}")
         
         if result:
             print(f"\n🔍 DETAILED RESULTS:")
+            lines = []
             for i, det in enumerate(result[:5]):  # Show top 5
-                text = det.get('text', 'N/A')
-                corner = det.get('corner', 'N/A')
-                is_watermark = det.get('is_watermark', False)
-                confidence = det.get('confidence', 0)
-                frame = det.get('frame', 'N/A')
-                multi_frame = det.get('multi_frame', False)
-                
-                print(f"    {i+1}. \"{text}\"")
-                print(f"       Position: {corner}")
-                print(f"       Watermark: {is_watermark}")
-                print(f"       Confidence: {confidence:.3f}")
-                print(f"       Frame: {frame}")
-                print(f"       Multi-frame: {multi_frame}")
-                print()
+                lines.append(
+                    f"    {i+1}. \"{det.get('text', 'N/A')}\"\n"
+                    f"       Position: {det.get('corner', 'N/A')}\n"
+                    f"       Watermark: {det.get('is_watermark', False)}\n"
+                    f"       Confidence: {det.get('confidence', 0):.3f}\n"
+                    f"       Frame: {det.get('frame', 'N/A')}\n"
+                    f"       Multi-frame: {det.get('multi_frame', False)}\n\n"
+                )
+            sys.stdout.write("".join(lines))
         
         # Success criteria
-        has_watermarks = len(watermarks) > 0
-        has_moving_detection = any(det.get('multi_frame', False) for det in result)
+        has_watermarks = watermark_count > 0
         fast_enough = detection_time < 30  # Should be under 30 seconds
         
         print(f"📈 SUCCESS METRICS:")
@@ -133,9 +139,8 @@ def test_moving_watermark_detection():
         
     finally:
         # Clean up
-        if os.path.exists(video_path):
-            os.remove(video_path)
-            print(f"🧹 Cleaned up test video")
+        Path(video_path).unlink(missing_ok=True)
+        print(f"🧹 Cleaned up test video")
 
 if __name__ == "__main__":
     test_moving_watermark_detection()
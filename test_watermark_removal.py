@@ -6,10 +6,16 @@ Test watermark removal functionality
 import cv2
 import numpy as np
 import sys
-import os
 import tempfile
+from pathlib import Path
 sys.path.append('.')
 
+from logo_detector import detect_logos_automatically
+from video_operations import VideoOperations
+
+# Computed once; every test video uses the same codec
+MP4V_FOURCC = cv2.VideoWriter_fourcc(*'mp4v')
+
 def test_watermark_removal():
     """Test the complete watermark detection and removal pipeline"""
     print("🧪 Testing watermark removal functionality...")
@@ -21,7 +27,6 @@ def test_watermark_removal():
         print(f"\n🔍 Testing detection on: {video_path}")
         
         # Test 1: Detection
-        from logo_detector import detect_logos_automatically
         detected_logos = detect_logos_automatically(video_path, '/opt/homebrew/bin/ffmpeg')
         
         print(f"📊 Detection Results:")
@@ -41,8 +46,6 @@ def test_watermark_removal():
         # Test 2: Check removal method selection
         print(f"\n🛠️  Testing removal method selection...")
         
-        from video_operations import VideoOperations
-        
         # Mock main window for testing
         class MockMainWindow:
             def __init__(self):
@@ -117,9 +120,8 @@ def test_watermark_removal():
         
     finally:
         # Clean up
-        if os.path.exists(video_path):
-            os.remove(video_path)
-            print(f"🧹 Cleaned up test video")
+        Path(video_path).unlink(missing_ok=True)
+        print(f"🧹 Cleaned up test video")
 
 def create_test_video_with_watermarks():
     """Create a test video with both fixed and moving watermarks"""
@@ -133,35 +135,49 @@ def create_test_video_with_watermarks():
     width, height = 1280, 720
     
     # Create video writer
-    fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-    out = cv2.VideoWriter(temp_video.name, fourcc, fps, (width, height))
+    out = cv2.VideoWriter(temp_video.name, MP4V_FOURCC, fps, (width, height))
     
     frames = fps * duration
     
-    for frame_num in range(frames):
-        # Create frame
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-        frame[:] = (30, 30, 30)  # Dark background
-        
+    def draw_frame(frame, frame_num):
         # Add main content
         cv2.rectangle(frame, (100, 100), (1180, 620), (50, 50, 100), -1)
         cv2.putText(frame, f"VIDEO CONTENT {frame_num + 1}", (400, 350), 
                    cv2.FONT_HERSHEY_SIMPLEX, 1.5, (255, 255, 255), 3)
-        
+    
         # Add fixed watermark (always in same position)
         cv2.putText(frame, "FIXED WATERMARK", (1000, 50), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (200, 200, 200), 2)
-        
+    
         # Add moving watermark (changes position)
         moving_x = 50 + (frame_num * 50)  # Moves right
         moving_y = 650
         cv2.putText(frame, "www.moving.com", (moving_x, moving_y), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.8, (180, 180, 180), 2)
-        
-        # Write frame
-        out.write(frame)
+        return frame
     
-    out.release()
+    # Draw on a UMat so OpenCV can offload to OpenCL when a device is present;
+    # any OpenCL failure (upload, drawing or download) switches to plain arrays
+    use_umat = cv2.ocl.haveOpenCL()
+    
+    try:
+        for frame_num in range(frames):
+            # Create frame
+            frame = np.full((height, width, 3), 30, dtype=np.uint8)  # Dark background
+            if use_umat:
+                try:
+                    # UMat copies the array, so a failed attempt leaves frame blank
+                    frame = draw_frame(cv2.UMat(frame), frame_num).get()
+                except cv2.error:
+                    use_umat = False
+                    draw_frame(frame, frame_num)
+            else:
+                draw_frame(frame, frame_num)
+        
+            # Write frame
+            out.write(frame)
+    finally:
+        out.release()
     return temp_video.name
 
 if __name__ == "__main__":
@@ -212,12 +212,9 @@ class ThemeAwareVideoApp(QWidget):
         try:
             style = get_app_style()
             print(f"Applying style with {len(style)} characters...")  # Debug output
+            # setStyleSheet() re-polishes and schedules a repaint itself
             self.setStyleSheet(style)
             
-            # Force a repaint
-            self.update()
-            self.repaint()
-            
         except Exception as e:
             print(f"Error applying theme: {e}")
         
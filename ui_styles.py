@@ -2,16 +2,121 @@
 UI Styling constants and styles for the Video Tool Pro application.
 """
 
-# Status color constants
-STATUS_COLORS = {
-    "ready": "color: #27ae60; background-color: rgba(39, 174, 96, 0.1);",
-    "working": "color: #f39c12; background-color: rgba(243, 156, 18, 0.1);",
-    "success": "color: #27ae60; background-color: rgba(39, 174, 96, 0.1);",
-    "error": "color: #e74c3c; background-color: rgba(231, 76, 60, 0.1);"
+import re
+import sys
+from enum import IntEnum
+
+# Shared palette; interned so every generated rule reuses one string per color
+_PALETTE = {name: sys.intern(value) for name, value in {
+    "primary": "#3498db",
+    "primary_hover": "#2980b9",
+    "primary_pressed": "#21618c",
+    "secondary": "#95a5a6",
+    "secondary_hover": "#7f8c8d",
+    "secondary_pressed": "#6c7b7d",
+    "success": "#27ae60",
+    "success_hover": "#229954",
+    "success_pressed": "#1e8449",
+    "accent": "#e74c3c",
+    "accent_hover": "#c0392b",
+    "accent_pressed": "#a93226",
+    "warning": "#f39c12",
+}.items()}
+
+# Status (foreground, background) color pairs; "ready" and "success" share one tone.
+# Backgrounds use Qt's #AARRGGBB form (10% alpha) rather than rgba() calls.
+_READY_TONE = (_PALETTE["success"], "#1a27ae60")
+STATUS_TONES = {
+    "ready": _READY_TONE,
+    "working": (_PALETTE["warning"], "#1af39c12"),
+    "success": _READY_TONE,
+    "error": (_PALETTE["accent"], "#1ae74c3c")
+}
+
+# Status stylesheets, rendered once per distinct tone (prefer set_status())
+_TONE_STYLES = {
+    tone: f"color: {tone[0]}; background-color: {tone[1]};"
+    for tone in set(STATUS_TONES.values())
 }
+STATUS_COLORS = {state: _TONE_STYLES[tone] for state, tone in STATUS_TONES.items()}
+
+
+class StatusState(IntEnum):
+    """Status label states, usable as direct indexes into STATUS_CSS/STATUS_NAMES"""
+    READY = 0
+    WORKING = 1
+    SUCCESS = 2
+    ERROR = 3
+
+
+STATUS_NAMES = tuple(state.name.lower() for state in StatusState)
+STATUS_CSS = tuple(STATUS_COLORS[name] for name in STATUS_NAMES)
+
+# QPushButton color variants: (object name, base, hover, pressed)
+_BUTTON_VARIANTS = tuple(
+    (f"{variant}_btn", _PALETTE[variant], _PALETTE[f"{variant}_hover"], _PALETTE[f"{variant}_pressed"])
+    for variant in ("primary", "secondary", "success", "accent")
+)
+
+
+def _button_variant_rules(variants):
+    """Render the normal/hover/pressed rules for each QPushButton color variant"""
+    return "".join(
+        f"QPushButton#{name}{{background-color:{base};color:white;}}"
+        f"QPushButton#{name}:hover{{background-color:{hover};}}"
+        f"QPushButton#{name}:pressed{{background-color:{pressed};}}"
+        for name, base, hover, pressed in variants
+    )
+
+
+def _status_rules(tones):
+    """Render a dynamic-property rule per status so transitions only need a repolish"""
+    return "".join(
+        f'QLabel#status_label[status="{state}"]{{color:{fg};background-color:{bg};}}'
+        for state, (fg, bg) in tones.items()
+    )
 
-# Main application stylesheet
-APP_STYLE = """
+
+# Progress chunk gradient, rendered once from the palette
+_PROGRESS_CHUNK_GRADIENT = (
+    f"qlineargradient(x1:0,y1:0,x2:1,y2:0,"
+    f"stop:0 {_PALETTE['primary']},stop:1 {_PALETTE['primary_hover']})"
+)
+
+# Top-level dialog classes that share the dialog background and button rules
+_DIALOG_HOSTS = ("QDialog", "QInputDialog", "QMessageBox")
+
+
+def _dialog_host_rules(hosts):
+    """Render the shared background rule for every dialog class"""
+    return f"{','.join(hosts)}{{background-color:#f5f5f5;color:#2c3e50;}}"
+
+
+def _dialog_button_rules(hosts):
+    """Render the normal/hover/pressed button rules shared by every dialog class"""
+    def selectors(state):
+        return ",".join(f"{host} QPushButton{state}" for host in hosts)
+
+    return (
+        f"{selectors('')}{{background-color:{_PALETTE['primary']};color:white;"
+        f"border-radius:6px;padding:8px 16px;font-size:13px;font-weight:600;min-width:80px;}}"
+        f"{selectors(':hover')}{{background-color:{_PALETTE['primary_hover']};}}"
+        f"{selectors(':pressed')}{{background-color:{_PALETTE['primary_pressed']};}}"
+    )
+
+
+def set_status(label, state):
+    """Switch a status label to a StatusState (or its name) without a new stylesheet"""
+    if isinstance(state, StatusState):
+        state = STATUS_NAMES[state]
+    label.setProperty("status", state)
+    style = label.style()
+    style.unpolish(label)
+    style.polish(label)
+
+
+# Main window stylesheet (readable source, see APP_STYLE_BASE for the minified form)
+_APP_STYLE_BASE_RAW = """
             QWidget {
                 background-color: #f5f5f5;
                 font-family: Arial, sans-serif;
@@ -79,7 +184,6 @@ APP_STYLE = """
             
             QLineEdit#input:focus {
                 border-color: #3498db;
-                outline: none;
             }
             
             QComboBox {
@@ -127,57 +231,7 @@ APP_STYLE = """
                 min-height: 20px;
             }
             
-            QPushButton#primary_btn {
-                background-color: #3498db;
-                color: white;
-            }
-            
-            QPushButton#primary_btn:hover {
-                background-color: #2980b9;
-            }
-            
-            QPushButton#primary_btn:pressed {
-                background-color: #21618c;
-            }
-            
-            QPushButton#secondary_btn {
-                background-color: #95a5a6;
-                color: white;
-            }
-            
-            QPushButton#secondary_btn:hover {
-                background-color: #7f8c8d;
-            }
-            
-            QPushButton#secondary_btn:pressed {
-                background-color: #6c7b7d;
-            }
-            
-            QPushButton#success_btn {
-                background-color: #27ae60;
-                color: white;
-            }
-            
-            QPushButton#success_btn:hover {
-                background-color: #229954;
-            }
-            
-            QPushButton#success_btn:pressed {
-                background-color: #1e8449;
-            }
-            
-            QPushButton#accent_btn {
-                background-color: #e74c3c;
-                color: white;
-            }
-            
-            QPushButton#accent_btn:hover {
-                background-color: #c0392b;
-            }
-            
-            QPushButton#accent_btn:pressed {
-                background-color: #a93226;
-            }
+        """ + _button_variant_rules(_BUTTON_VARIANTS) + """
             
             QTextEdit#log {
                 background-color: #2c3e50;
@@ -190,19 +244,19 @@ APP_STYLE = """
                 line-height: 1.4;
             }
             
-            QScrollBar:vertical {
+            QTextEdit#log QScrollBar:vertical {
                 background-color: #34495e;
                 width: 12px;
                 border-radius: 6px;
             }
             
-            QScrollBar::handle:vertical {
+            QTextEdit#log QScrollBar::handle:vertical {
                 background-color: #7f8c8d;
                 border-radius: 6px;
                 min-height: 20px;
             }
             
-            QScrollBar::handle:vertical:hover {
+            QTextEdit#log QScrollBar::handle:vertical:hover {
                 background-color: #95a5a6;
             }
             
@@ -212,9 +266,11 @@ APP_STYLE = """
                 color: #27ae60;
                 padding: 5px 10px;
                 border-radius: 5px;
-                background-color: rgba(39, 174, 96, 0.1);
+                background-color: #1a27ae60;
             }
             
+        """ + _status_rules(STATUS_TONES) + """
+            
             QLabel#elapsed_label {
                 font-size: 12px;
                 color: #7f8c8d;
@@ -231,22 +287,16 @@ APP_STYLE = """
             }
             
             QProgressBar#progress_bar::chunk {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #3498db, stop: 1 #2980b9);
+                background-color: """ + _PROGRESS_CHUNK_GRADIENT + """;
                 border-radius: 6px;
                 margin: 2px;
             }
-            
+        """
+
+# Dialog-only rules, kept separate so callers can scope them to dialogs
+_DIALOG_STYLE_RAW = """
             /* Dialog styles */
-            QDialog {
-                background-color: #f5f5f5;
-                color: #2c3e50;
-            }
-            
-            QInputDialog {
-                background-color: #f5f5f5;
-                color: #2c3e50;
-            }
+        """ + _dialog_host_rules(_DIALOG_HOSTS) + """
             
             QInputDialog QLineEdit {
                 background-color: white;
@@ -285,65 +335,52 @@ APP_STYLE = """
             }
             
             /* Dialog Button Styles */
-            QDialog QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QDialog QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QDialog QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QInputDialog QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QInputDialog QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QInputDialog QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QMessageBox {
-                background-color: #f5f5f5;
-                color: #2c3e50;
-            }
+        """ + _dialog_button_rules(_DIALOG_HOSTS) + """
         """
+
+
+# One pass: comments count as whitespace; whitespace runs around punctuation
+# are dropped, any other run collapses to a single space
+_QSS_GAP = r"(?:\s|/\*.*?\*/)"
+_QSS_MINIFY_RE = re.compile(rf"{_QSS_GAP}*([{{}};:,]){_QSS_GAP}*|{_QSS_GAP}+", re.S)
+
+
+def minify_qss(src):
+    """Strip comments and redundant whitespace from a Qt stylesheet"""
+    return _QSS_MINIFY_RE.sub(lambda m: m.group(1) or " ", src).strip()
+
+
+def get_app_style():
+    """Get the full application stylesheet, minified on first use and reused"""
+    return __getattr__("APP_STYLE")
+
+
+def install_app_style(widget):
+    """Apply the app stylesheet to a widget, skipping the re-polish if it is already applied"""
+    style = get_app_style()
+    # get_app_style() always returns the same cached object, so its id identifies the content
+    style_id = id(style)
+    if widget.property("_app_style_id") == style_id:
+        return
+    widget.setStyleSheet(style)
+    widget.setProperty("_app_style_id", style_id)
+
+
+# Stylesheets are minified on first access rather than at import, so modules
+# that only need STATUS_COLORS/set_status never build them
+_LAZY_STYLES = {
+    "APP_STYLE_BASE": lambda: minify_qss(_APP_STYLE_BASE_RAW),
+    "DIALOG_STYLE": lambda: minify_qss(_DIALOG_STYLE_RAW),
+    "APP_STYLE": lambda: __getattr__("APP_STYLE_BASE") + __getattr__("DIALOG_STYLE"),
+}
+
+
+def __getattr__(name):
+    """Build lazy stylesheet attributes on first access (PEP 562)"""
+    if name in globals():
+        return globals()[name]
+    builder = _LAZY_STYLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
@@ -3,439 +3,236 @@ UI Styling constants and styles for the Video Tool Pro application.
 Supports both light and dark themes with theme switching functionality.
 """
 
+import sys
+from enum import IntEnum
+from functools import lru_cache
+from string import Template
+from types import MappingProxyType
+
+from ui_styles import minify_qss
+
+class Theme(IntEnum):
+    """Available themes, usable as direct indexes into per-theme tuples"""
+    LIGHT = 0
+    DARK = 1
+
+THEME_NAMES = tuple(theme.name.lower() for theme in Theme)
+_THEMES_BY_NAME = dict(zip(THEME_NAMES, Theme))
+
 # Theme management
 class ThemeManager:
     """Manages theme switching between light and dark modes"""
     
     def __init__(self):
-        self.current_theme = "light"  # Default theme
+        self.theme = Theme.LIGHT  # Default theme; indexes the per-theme tuples
+        self.style_version = 0  # Bumped whenever the theme actually changes
+        self._refresh_theme_cache()
+    
+    def _refresh_theme_cache(self):
+        """Resolve the stylesheet and status colors for the current theme once"""
+        self._app_style = _render(self.theme)
+        self._app_style_parts = _render_parts(self.theme)
+        self._status_colors = _STATUS_COLORS_BY_THEME[self.theme]
+    
+    @property
+    def current_theme(self):
+        """Current theme name ("light" or "dark"), as before Theme existed"""
+        return THEME_NAMES[self.theme]
+    
+    @current_theme.setter
+    def current_theme(self, theme):
+        self.set_theme(theme)
     
     def toggle_theme(self):
         """Toggle between light and dark themes"""
-        self.current_theme = "dark" if self.current_theme == "light" else "light"
-        return self.current_theme
+        return self.set_theme(Theme.LIGHT if self.theme is Theme.DARK else Theme.DARK)
     
     def set_theme(self, theme):
-        """Set specific theme (light or dark)"""
-        if theme in ["light", "dark"]:
-            self.current_theme = theme
-        return self.current_theme
+        """Set specific theme ("light", "dark" or a Theme), ignoring anything
+        else; a no-op when it is already current, so the cached styles and
+        style_version are kept"""
+        if isinstance(theme, str):
+            theme = _THEMES_BY_NAME.get(theme)
+        if isinstance(theme, Theme) and theme is not self.theme:
+            self.theme = theme
+            self.style_version += 1
+            self._refresh_theme_cache()
+        return self.get_current_theme()
     
     def get_current_theme(self):
-        """Get current theme"""
+        """Get current theme name ("light" or "dark")"""
         return self.current_theme
 
-# Global theme manager instance
-theme_manager = ThemeManager()
+class StatusState(IntEnum):
+    """Status label states, usable as direct indexes into STATUS_CSS_*/STATUS_NAMES"""
+    READY = 0
+    WORKING = 1
+    SUCCESS = 2
+    ERROR = 3
+
+STATUS_NAMES = tuple(state.name.lower() for state in StatusState)
 
-# Status color constants for light theme
-STATUS_COLORS_LIGHT = {
+# Status color constants for light theme (read-only)
+STATUS_COLORS_LIGHT = MappingProxyType({
     "ready": "color: #27ae60; background-color: rgba(39, 174, 96, 0.1);",
     "working": "color: #f39c12; background-color: rgba(243, 156, 18, 0.1);",
     "success": "color: #27ae60; background-color: rgba(39, 174, 96, 0.1);",
     "error": "color: #e74c3c; background-color: rgba(231, 76, 60, 0.1);"
-}
+})
 
-# Status color constants for dark theme
-STATUS_COLORS_DARK = {
+# Status color constants for dark theme (read-only)
+STATUS_COLORS_DARK = MappingProxyType({
     "ready": "color: #2ecc71; background-color: rgba(46, 204, 113, 0.2);",
     "working": "color: #f1c40f; background-color: rgba(241, 196, 15, 0.2);",
     "success": "color: #2ecc71; background-color: rgba(46, 204, 113, 0.2);",
     "error": "color: #e67e22; background-color: rgba(230, 126, 34, 0.2);"
-}
+})
+
+# Same colors indexed by StatusState
+STATUS_CSS_LIGHT = tuple(STATUS_COLORS_LIGHT[name] for name in STATUS_NAMES)
+STATUS_CSS_DARK = tuple(STATUS_COLORS_DARK[name] for name in STATUS_NAMES)
+
+# Indexed by Theme
+_STATUS_COLORS_BY_THEME = (STATUS_COLORS_LIGHT, STATUS_COLORS_DARK)
+_STATUS_CSS_BY_THEME = (STATUS_CSS_LIGHT, STATUS_CSS_DARK)
 
 # Dynamic status colors based on current theme
 def get_status_colors():
     """Get status colors for current theme"""
-    return STATUS_COLORS_DARK if theme_manager.current_theme == "dark" else STATUS_COLORS_LIGHT
+    return theme_manager._status_colors
+
+@lru_cache(maxsize=8)
+def status_style(theme, state):
+    """Resolve the status stylesheet for a Theme and a StatusState or state name"""
+    if isinstance(state, StatusState):
+        return _STATUS_CSS_BY_THEME[theme][state]
+    return _STATUS_COLORS_BY_THEME[theme][state]
+
+def get_status_style(state):
+    """Get the status stylesheet for a state in the current theme"""
+    return status_style(theme_manager.theme, state)
 
 # For backward compatibility
 STATUS_COLORS = STATUS_COLORS_LIGHT
 
-# Light theme stylesheet
-APP_STYLE_LIGHT = """
-            QWidget {
-                background-color: #f5f5f5;
-                font-family: Arial, sans-serif;
-                color: #2c3e50;
-            }
-            
-            QLabel#title {
-                font-size: 28px;
-                font-weight: bold;
-                color: #2c3e50;
-                margin: 10px 0;
-                padding: 10px;
-            }
-            
-            QLabel#subtitle {
-                font-size: 14px;
-                color: #7f8c8d;
-                margin-bottom: 20px;
-            }
-            
-            QFrame#separator {
-                color: #bdc3c7;
-                margin: 10px 0;
-            }
-            
-            QGroupBox#group {
-                font-size: 16px;
-                font-weight: bold;
-                color: #34495e;
-                border: 2px solid #bdc3c7;
-                border-radius: 10px;
-                margin: 10px 0;
-                padding-top: 15px;
-            }
-            
-            QGroupBox#group::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 10px 0 10px;
-                background-color: #f5f5f5;
-            }
-            
-            QLabel#label {
-                font-size: 14px;
-                font-weight: 600;
-                color: #2c3e50;
-                margin: 5px 0;
-            }
-            
-            QLabel#info_label {
-                font-size: 12px;
-                color: #7f8c8d;
-                font-style: italic;
-                margin: 5px 0;
-            }
-            
-            QLineEdit#input {
-                padding: 12px 15px;
-                font-size: 14px;
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                background-color: white;
-                color: #2c3e50;
-                selection-background-color: #3498db;
-            }
-            
-            QLineEdit#input:focus {
-                border-color: #3498db;
-                outline: none;
-            }
-            
-            QComboBox {
-                padding: 8px 12px;
-                font-size: 14px;
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                background-color: white;
-                color: #2c3e50;
-                min-width: 200px;
-            }
-            
-            QComboBox:focus {
-                border-color: #3498db;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid #7f8c8d;
-                margin-right: 10px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: white;
-                color: #2c3e50;
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                selection-background-color: #3498db;
-                selection-color: white;
-            }
-            
-            QPushButton {
-                font-size: 14px;
-                font-weight: 600;
-                padding: 12px 20px;
-                border: none;
-                border-radius: 8px;
-                min-height: 20px;
-            }
-            
-            QPushButton#primary_btn {
-                background-color: #3498db;
-                color: white;
-            }
-            
-            QPushButton#primary_btn:hover {
-                background-color: #2980b9;
-            }
-            
-            QPushButton#primary_btn:pressed {
-                background-color: #21618c;
-            }
-            
-            QPushButton#secondary_btn {
-                background-color: #95a5a6;
-                color: white;
-            }
-            
-            QPushButton#secondary_btn:hover {
-                background-color: #7f8c8d;
-            }
-            
-            QPushButton#secondary_btn:pressed {
-                background-color: #6c7b7d;
-            }
-            
-            QPushButton#success_btn {
-                background-color: #27ae60;
-                color: white;
-            }
-            
-            QPushButton#success_btn:hover {
-                background-color: #229954;
-            }
-            
-            QPushButton#success_btn:pressed {
-                background-color: #1e8449;
-            }
-            
-            QPushButton#accent_btn {
-                background-color: #e74c3c;
-                color: white;
-            }
-            
-            QPushButton#accent_btn:hover {
-                background-color: #c0392b;
-            }
-            
-            QPushButton#accent_btn:pressed {
-                background-color: #a93226;
-            }
-            
-            QPushButton#theme_btn {
-                background-color: #9b59b6;
-                color: white;
-            }
-            
-            QPushButton#theme_btn:hover {
-                background-color: #8e44ad;
-            }
-            
-            QPushButton#theme_btn:pressed {
-                background-color: #7d3c98;
-            }
-            
-            QTextEdit#log {
-                background-color: #2c3e50;
-                color: #ecf0f1;
-                border: 2px solid #34495e;
-                border-radius: 8px;
-                font-family: 'Monaco', 'Courier New', monospace;
-                font-size: 12px;
-                padding: 10px;
-                line-height: 1.4;
-            }
-            
-            QScrollBar:vertical {
-                background-color: #34495e;
-                width: 12px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #7f8c8d;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #95a5a6;
-            }
-            
-            QLabel#status_label {
-                font-size: 14px;
-                font-weight: bold;
-                color: #27ae60;
-                padding: 5px 10px;
-                border-radius: 5px;
-                background-color: rgba(39, 174, 96, 0.1);
-            }
-            
-            QLabel#elapsed_label {
-                font-size: 12px;
-                color: #7f8c8d;
-                font-family: 'Monaco', 'Courier New', monospace;
-            }
-            
-            QProgressBar#progress_bar {
-                border: 2px solid #bdc3c7;
-                border-radius: 8px;
-                text-align: center;
-                font-weight: bold;
-                background-color: #ecf0f1;
-                height: 25px;
-            }
-            
-            QProgressBar#progress_bar::chunk {
-                background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #3498db, stop: 1 #2980b9);
-                border-radius: 6px;
-                margin: 2px;
-            }
-            
-            /* Dialog styles */
-            QDialog {
-                background-color: #f5f5f5;
-                color: #2c3e50;
-            }
-            
-            QInputDialog {
-                background-color: #f5f5f5;
-                color: #2c3e50;
-            }
-            
-            QInputDialog QLineEdit {
-                background-color: white;
-                color: #2c3e50;
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-                padding: 8px;
-            }
-            
-            QInputDialog QComboBox {
-                background-color: white;
-                color: #2c3e50;
-                border: 2px solid #bdc3c7;
-                border-radius: 4px;
-                padding: 8px;
-            }
-            
-            QInputDialog QComboBox::drop-down {
-                border: none;
-                width: 20px;
-            }
-            
-            QInputDialog QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #7f8c8d;
-            }
-            
-            QInputDialog QComboBox QAbstractItemView {
-                background-color: white;
-                color: #2c3e50;
-                border: 1px solid #bdc3c7;
-                selection-background-color: #3498db;
-                selection-color: white;
-            }
-            
-            /* Dialog Button Styles */
-            QDialog QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QDialog QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QDialog QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QInputDialog QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QInputDialog QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QInputDialog QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QMessageBox {
-                background-color: #f5f5f5;
-                color: #2c3e50;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #21618c;
-            }
-        """
+# Button roles with hover/pressed colors; a palette that omits them gets
+# them derived from the base color
+_BUTTON_ROLES = ("primary", "secondary", "success", "accent", "theme")
+
+@lru_cache(maxsize=64)
+def _shade(hex_, factor):
+    """Scale each channel of a #rrggbb color by factor (< 1 darkens)"""
+    r, g, b = (min(255, max(0, int(int(hex_[i:i + 2], 16) * factor))) for i in (1, 3, 5))
+    return sys.intern("#%02x%02x%02x" % (r, g, b))
+
+def _with_shades(palette):
+    """Add the hover (15% darker) and pressed (30% darker) color of each button
+    role the palette does not set explicitly"""
+    for role in _BUTTON_ROLES:
+        palette.setdefault(role + "_hover", _shade(palette[role], 0.85))
+        palette.setdefault(role + "_pressed", _shade(palette[role], 0.7))
+    return palette
+
+# Theme palettes, substituted into APP_STYLE_TEMPLATE_PARTS; interned so
+# colors shared by both themes are one string object. Both themes list their
+# hand-picked button states (the dark theme's lighten on hover); _with_shades
+# only fills in roles added without them
+LIGHT_PALETTE = _with_shades({name: sys.intern(value) for name, value in {
+    "bg": "#f5f5f5",
+    "fg": "#2c3e50",
+    "muted": "#7f8c8d",
+    "border": "#bdc3c7",
+    "group_fg": "#34495e",
+    "input_bg": "white",
+    "primary": "#3498db",
+    "primary_hover": "#2980b9",
+    "primary_pressed": "#21618c",
+    "secondary": "#95a5a6",
+    "secondary_hover": "#7f8c8d",
+    "secondary_pressed": "#6c7b7d",
+    "success": "#27ae60",
+    "success_hover": "#229954",
+    "success_pressed": "#1e8449",
+    "accent": "#e74c3c",
+    "accent_hover": "#c0392b",
+    "accent_pressed": "#a93226",
+    "theme": "#9b59b6",
+    "theme_hover": "#8e44ad",
+    "theme_pressed": "#7d3c98",
+    "log_bg": "#2c3e50",
+    "log_fg": "#ecf0f1",
+    "log_border": "#34495e",
+    "scrollbar_bg": "#34495e",
+    "status_bg": "rgba(39, 174, 96, 0.1)",
+    "progress_bg": "#ecf0f1",
+}.items()})
 
-# Dark theme stylesheet
-APP_STYLE_DARK = """
+DARK_PALETTE = _with_shades({name: sys.intern(value) for name, value in {
+    "bg": "#2b2b2b",
+    "fg": "#ffffff",
+    "muted": "#bdc3c7",
+    "border": "#555555",
+    "group_fg": "#ffffff",
+    "input_bg": "#3c3c3c",
+    "primary": "#5dade2",
+    "primary_hover": "#3498db",
+    "primary_pressed": "#2980b9",
+    "secondary": "#7f8c8d",
+    "secondary_hover": "#95a5a6",
+    "secondary_pressed": "#6c7b7d",
+    "success": "#2ecc71",
+    "success_hover": "#27ae60",
+    "success_pressed": "#229954",
+    "accent": "#e67e22",
+    "accent_hover": "#d35400",
+    "accent_pressed": "#a04000",
+    "theme": "#af7ac5",
+    "theme_hover": "#9b59b6",
+    "theme_pressed": "#8e44ad",
+    "log_bg": "#1e1e1e",
+    "log_fg": "#ffffff",
+    "log_border": "#555555",
+    "scrollbar_bg": "#3c3c3c",
+    "status_bg": "rgba(46, 204, 113, 0.2)",
+    "progress_bg": "#3c3c3c",
+}.items()})
+
+# Indexed by Theme
+_PALETTES = (LIGHT_PALETTE, DARK_PALETTE)
+
+# Stylesheet template shared by both themes, split per widget group ($name = palette entry)
+APP_STYLE_TEMPLATE_PARTS = {
+    "base": """
             QWidget {
-                background-color: #2b2b2b;
+                background-color: $bg;
                 font-family: Arial, sans-serif;
-                color: #ffffff;
+                color: $fg;
             }
             
             QLabel#title {
                 font-size: 28px;
                 font-weight: bold;
-                color: #ffffff;
+                color: $fg;
                 margin: 10px 0;
                 padding: 10px;
             }
             
             QLabel#subtitle {
                 font-size: 14px;
-                color: #bdc3c7;
+                color: $muted;
                 margin-bottom: 20px;
             }
             
             QFrame#separator {
-                color: #555555;
+                color: $border;
                 margin: 10px 0;
             }
             
             QGroupBox#group {
                 font-size: 16px;
                 font-weight: bold;
-                color: #ffffff;
-                border: 2px solid #555555;
+                color: $group_fg;
+                border: 2px solid $border;
                 border-radius: 10px;
                 margin: 10px 0;
                 padding-top: 15px;
@@ -445,50 +242,51 @@ APP_STYLE_DARK = """
                 subcontrol-origin: margin;
                 left: 10px;
                 padding: 0 10px 0 10px;
-                background-color: #2b2b2b;
+                background-color: $bg;
             }
             
             QLabel#label {
                 font-size: 14px;
                 font-weight: 600;
-                color: #ffffff;
+                color: $fg;
                 margin: 5px 0;
             }
             
             QLabel#info_label {
                 font-size: 12px;
-                color: #bdc3c7;
+                color: $muted;
                 font-style: italic;
                 margin: 5px 0;
             }
-            
+        """,
+    "inputs": """
             QLineEdit#input {
                 padding: 12px 15px;
                 font-size: 14px;
-                border: 2px solid #555555;
+                border: 2px solid $border;
                 border-radius: 8px;
-                background-color: #3c3c3c;
-                color: #ffffff;
-                selection-background-color: #5dade2;
+                background-color: $input_bg;
+                color: $fg;
+                selection-background-color: $primary;
             }
             
             QLineEdit#input:focus {
-                border-color: #5dade2;
+                border-color: $primary;
                 outline: none;
             }
             
             QComboBox {
                 padding: 8px 12px;
                 font-size: 14px;
-                border: 2px solid #555555;
+                border: 2px solid $border;
                 border-radius: 8px;
-                background-color: #3c3c3c;
-                color: #ffffff;
+                background-color: $input_bg;
+                color: $fg;
                 min-width: 200px;
             }
             
             QComboBox:focus {
-                border-color: #5dade2;
+                border-color: $primary;
             }
             
             QComboBox::drop-down {
@@ -500,19 +298,20 @@ APP_STYLE_DARK = """
                 image: none;
                 border-left: 5px solid transparent;
                 border-right: 5px solid transparent;
-                border-top: 5px solid #bdc3c7;
+                border-top: 5px solid $muted;
                 margin-right: 10px;
             }
             
             QComboBox QAbstractItemView {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 2px solid #555555;
+                background-color: $input_bg;
+                color: $fg;
+                border: 2px solid $border;
                 border-radius: 8px;
-                selection-background-color: #5dade2;
+                selection-background-color: $primary;
                 selection-color: white;
             }
-            
+        """,
+    "buttons": """
             QPushButton {
                 font-size: 14px;
                 font-weight: 600;
@@ -523,74 +322,75 @@ APP_STYLE_DARK = """
             }
             
             QPushButton#primary_btn {
-                background-color: #5dade2;
+                background-color: $primary;
                 color: white;
             }
             
             QPushButton#primary_btn:hover {
-                background-color: #3498db;
+                background-color: $primary_hover;
             }
             
             QPushButton#primary_btn:pressed {
-                background-color: #2980b9;
+                background-color: $primary_pressed;
             }
             
             QPushButton#secondary_btn {
-                background-color: #7f8c8d;
+                background-color: $secondary;
                 color: white;
             }
             
             QPushButton#secondary_btn:hover {
-                background-color: #95a5a6;
+                background-color: $secondary_hover;
             }
             
             QPushButton#secondary_btn:pressed {
-                background-color: #6c7b7d;
+                background-color: $secondary_pressed;
             }
             
             QPushButton#success_btn {
-                background-color: #2ecc71;
+                background-color: $success;
                 color: white;
             }
             
             QPushButton#success_btn:hover {
-                background-color: #27ae60;
+                background-color: $success_hover;
             }
             
             QPushButton#success_btn:pressed {
-                background-color: #229954;
+                background-color: $success_pressed;
             }
             
             QPushButton#accent_btn {
-                background-color: #e67e22;
+                background-color: $accent;
                 color: white;
             }
             
             QPushButton#accent_btn:hover {
-                background-color: #d35400;
+                background-color: $accent_hover;
             }
             
             QPushButton#accent_btn:pressed {
-                background-color: #a04000;
+                background-color: $accent_pressed;
             }
             
             QPushButton#theme_btn {
-                background-color: #af7ac5;
+                background-color: $theme;
                 color: white;
             }
             
             QPushButton#theme_btn:hover {
-                background-color: #9b59b6;
+                background-color: $theme_hover;
             }
             
             QPushButton#theme_btn:pressed {
-                background-color: #8e44ad;
+                background-color: $theme_pressed;
             }
-            
+        """,
+    "log": """
             QTextEdit#log {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: 2px solid #555555;
+                background-color: $log_bg;
+                color: $log_fg;
+                border: 2px solid $log_border;
                 border-radius: 8px;
                 font-family: 'Monaco', 'Courier New', monospace;
                 font-size: 12px;
@@ -599,7 +399,7 @@ APP_STYLE_DARK = """
             }
             
             QScrollBar:vertical {
-                background-color: #3c3c3c;
+                background-color: $scrollbar_bg;
                 width: 12px;
                 border-radius: 6px;
             }
@@ -613,62 +413,51 @@ APP_STYLE_DARK = """
             QScrollBar::handle:vertical:hover {
                 background-color: #95a5a6;
             }
-            
+        """,
+    "status": """
             QLabel#status_label {
                 font-size: 14px;
                 font-weight: bold;
-                color: #2ecc71;
+                color: $success;
                 padding: 5px 10px;
                 border-radius: 5px;
-                background-color: rgba(46, 204, 113, 0.2);
+                background-color: $status_bg;
             }
             
             QLabel#elapsed_label {
                 font-size: 12px;
-                color: #bdc3c7;
+                color: $muted;
                 font-family: 'Monaco', 'Courier New', monospace;
             }
             
             QProgressBar#progress_bar {
-                border: 2px solid #555555;
+                border: 2px solid $border;
                 border-radius: 8px;
                 text-align: center;
                 font-weight: bold;
-                background-color: #3c3c3c;
+                background-color: $progress_bg;
                 height: 25px;
-                color: #ffffff;
+                color: $fg;
             }
             
             QProgressBar#progress_bar::chunk {
                 background-color: qlineargradient(x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 #5dade2, stop: 1 #3498db);
+                    stop: 0 $primary, stop: 1 $primary_hover);
                 border-radius: 6px;
                 margin: 2px;
             }
-            
+        """,
+    "dialogs": """
             /* Dialog styles */
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            QInputDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            QInputDialog QLineEdit {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 2px solid #555555;
-                border-radius: 4px;
-                padding: 8px;
+            QDialog, QInputDialog, QMessageBox {
+                background-color: $bg;
+                color: $fg;
             }
             
-            QInputDialog QComboBox {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 2px solid #555555;
+            QInputDialog QLineEdit, QInputDialog QComboBox {
+                background-color: $input_bg;
+                color: $fg;
+                border: 2px solid $border;
                 border-radius: 4px;
                 padding: 8px;
             }
@@ -682,20 +471,20 @@ APP_STYLE_DARK = """
                 image: none;
                 border-left: 4px solid transparent;
                 border-right: 4px solid transparent;
-                border-top: 4px solid #bdc3c7;
+                border-top: 4px solid $muted;
             }
             
             QInputDialog QComboBox QAbstractItemView {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #555555;
-                selection-background-color: #5dade2;
+                background-color: $input_bg;
+                color: $fg;
+                border: 1px solid $border;
+                selection-background-color: $primary;
                 selection-color: white;
             }
             
             /* Dialog Button Styles */
-            QDialog QPushButton {
-                background-color: #5dade2;
+            QDialog QPushButton, QInputDialog QPushButton, QMessageBox QPushButton {
+                background-color: $primary;
                 color: white;
                 border: none;
                 border-radius: 6px;
@@ -705,62 +494,82 @@ APP_STYLE_DARK = """
                 min-width: 80px;
             }
             
-            QDialog QPushButton:hover {
-                background-color: #3498db;
+            QDialog QPushButton:hover, QInputDialog QPushButton:hover, QMessageBox QPushButton:hover {
+                background-color: $primary_hover;
             }
             
-            QDialog QPushButton:pressed {
-                background-color: #2980b9;
+            QDialog QPushButton:pressed, QInputDialog QPushButton:pressed, QMessageBox QPushButton:pressed {
+                background-color: $primary_pressed;
             }
-            
-            QInputDialog QPushButton {
-                background-color: #5dade2;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QInputDialog QPushButton:hover {
-                background-color: #3498db;
-            }
-            
-            QInputDialog QPushButton:pressed {
-                background-color: #2980b9;
-            }
-            
-            QMessageBox {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #5dade2;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #3498db;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #2980b9;
-            }
-        """
+        """,
+}
+
+@lru_cache(maxsize=2)
+def _render_parts(theme):
+    """Render and minify the style parts for a theme, once per theme"""
+    palette = _PALETTES[theme]
+    return {
+        name: minify_qss(Template(part).substitute(palette))
+        for name, part in APP_STYLE_TEMPLATE_PARTS.items()
+    }
+
+@lru_cache(maxsize=2)
+def _render(theme):
+    """Render the full minified stylesheet for a theme, once per theme"""
+    return "".join(_render_parts(theme).values())
+
+APP_STYLE_LIGHT_PARTS = _render_parts(Theme.LIGHT)
+APP_STYLE_LIGHT = _render(Theme.LIGHT)
+
+# The dark theme is only rendered once something asks for it
+_LAZY_STYLES = {
+    "APP_STYLE_DARK_PARTS": lambda: _render_parts(Theme.DARK),
+    "APP_STYLE_DARK": lambda: _render(Theme.DARK),
+}
+
+def __getattr__(name):
+    """Render the dark theme's stylesheets the first time one is read (PEP 562)"""
+    builder = _LAZY_STYLES.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = builder()
+    return value
+
+# Global theme manager instance (created once the templates are defined)
+theme_manager = ThemeManager()
 
 # Dynamic theme functions
 def get_app_style():
     """Get the current theme's app style"""
-    return APP_STYLE_DARK if theme_manager.current_theme == "dark" else APP_STYLE_LIGHT
+    return theme_manager._app_style
+
+def get_app_style_part(name):
+    """Get one widget group ("base", "inputs", "buttons", "log", "status" or
+    "dialogs") of the current theme's app style, for targeted restyles"""
+    return theme_manager._app_style_parts[name]
+
+def compose_style(*parts):
+    """Join stylesheet parts (e.g. get_app_style_part("base") plus a per-widget
+    override) in one pass; empty parts are skipped"""
+    return "\n".join(part for part in parts if part)
+
+def batch_apply_theme(widgets):
+    """Apply the current theme's app style to several top-level widgets at once
+
+    Painting is suspended on every widget while the stylesheets are set, so the
+    re-polishes coalesce into a single repaint once updates are re-enabled.
+    Child widgets inherit the sheet; pass only windows and open dialogs.
+    """
+    widgets = list(widgets)
+    app_style = get_app_style()
+    for widget in widgets:
+        widget.setUpdatesEnabled(False)
+    try:
+        for widget in widgets:
+            widget.setStyleSheet(app_style)
+    finally:
+        for widget in widgets:
+            widget.setUpdatesEnabled(True)
 
 def toggle_theme():
     """Toggle between light and dark themes"""
@@ -774,5 +583,10 @@ def get_current_theme():
     """Get current theme name"""
     return theme_manager.get_current_theme()
 
+def get_style_version():
+    """Get a counter that changes whenever the theme does; callers can store
+    the version they last applied and skip setStyleSheet() while it matches"""
+    return theme_manager.style_version
+
 # For backward compatibility
 APP_STYLE = APP_STYLE_LIGHT
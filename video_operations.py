@@ -1,15 +1,100 @@
+import heapq
+import json
 import os
+import re
 import subprocess
+import threading
+from collections import deque
+from PyQt6.QtCore import QSettings, QTimer
 from PyQt6.QtWidgets import QInputDialog, QFileDialog, QMessageBox
-from worker_thread import WorkerThread
+from worker_thread import FOLDER_JOBS, LOGO_ENCODE_FLAGS, WorkerThread
 
 
 class VideoOperations:
     """Handles all video processing operations"""
     
+    # Extensions (without the dot) picked up by the folder operations
+    _VIDEO_EXTS = frozenset({'mp4', 'avi', 'mov', 'mkv', 'wmv', 'flv', 'webm', 'm4v'})
+    
+    # Folders a recursive scan never enters: system/tool folders, and the
+    # outputs of earlier flip, convert and split runs
+    _SKIP_DIRS = frozenset({'@eaDir', '$RECYCLE.BIN', 'System Volume Information', 'node_modules'})
+    _OUTPUT_DIR_PREFIXES = ('flipped_videos_',)
+    _OUTPUT_DIR_SUFFIXES = ('_converted',)
+    # split_video's "<stem>_parts_<N>min" folders (N may be fractional for custom durations)
+    _PARTS_DIR_RE = re.compile(r".+_parts_\d+(?:\.\d+)?min")
+    
+    # Substrings of detected text that mark it as a watermark
+    _WATERMARK_INDICATORS = ('www', '.com', '©', '®', '™')
+    
+    _FLIP_OPTIONS = ("Horizontal (hflip)", "Vertical (vflip)", "Both (hflip,vflip)")
+    
+    # Split presets: (dialog label, seconds, output folder tag)
+    _SPLIT_DURATIONS = (
+        ("1 minute (60 seconds)", 60, "1min"),
+        ("2 minutes (120 seconds)", 120, "2min"),
+        ("3 minutes (180 seconds)", 180, "3min"),
+        ("5 minutes (300 seconds)", 300, "5min"),
+        ("10 minutes (600 seconds)", 600, "10min"),
+        ("15 minutes (900 seconds)", 900, "15min"),
+        ("20 minutes (1200 seconds)", 1200, "20min"),
+        ("30 minutes (1800 seconds)", 1800, "30min"),
+    )
+    _DURATION_LABELS = [label for label, _, _ in _SPLIT_DURATIONS] + ["Custom duration"]
+    
+    # Hardware H.264 encoders in order of preference, with flags roughly matching
+    # libx264 at CRF 23. VAAPI is left out: it needs hwupload in every filter graph.
+    _HW_ENCODERS = (
+        ("h264_nvenc", ("-preset", "p4", "-rc", "vbr", "-cq", "23")),
+        ("h264_qsv", ("-preset", "veryfast", "-global_quality", "23")),
+        ("h264_videotoolbox", ("-q:v", "65")),
+    )
+    # Consumer GPUs cap concurrent encode sessions, and one session already
+    # keeps the encoder block busy
+    _HW_FOLDER_JOBS = 2
+    
+    _LOG_FLUSH_MS = 100
+    
+    # Seconds before an ffmpeg capability probe is given up on
+    _PROBE_TIMEOUT = 10
+    _HW_PROBE_PENDING = object()
+    
     def __init__(self, main_window):
         self.main_window = main_window
-        
+        # libx264 settings for the flip/convert re-encodes
+        self.encode_preset = "veryfast"
+        self.encode_threads = os.cpu_count() or 0  # 0 lets x264 decide
+        self.use_hw_encoder = True  # Use hw_encoder for flip/convert when one works
+        self.folder_jobs = None  # Parallel ffmpeg processes for folder operations; None = FOLDER_JOBS
+        # Folder scans keyed by folder (valid while its mtime is unchanged) and
+        # ffprobe metadata keyed by (path, mtime, size)
+        self._scan_cache = {}
+        self._probe_cache = {}
+        self._detector = None  # LogoDetector, see _logo_detector()
+        self._hw_encoders = {}  # ffmpeg path -> hw_encoder probe result (_HW_PROBE_PENDING while it runs)
+        # Worker progress lines are buffered and flushed at most every
+        # _LOG_FLUSH_MS, so busy ffmpeg output can't flood the event loop
+        self._log_buf = deque(maxlen=256)
+        self._log_timer = QTimer(singleShot=True, timeout=self._flush_log)
+        
+    def _enqueue_log(self, message):
+        """Buffer a worker progress message for the next log flush"""
+        self._log_buf.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start(self._LOG_FLUSH_MS)
+    
+    def _flush_log(self):
+        """Write all buffered progress messages to the log at once"""
+        if self._log_buf:
+            self.main_window.log_message("\n".join(self._log_buf))
+            self._log_buf.clear()
+    
+    def _finish_operation(self, success, message):
+        """Flush pending progress before reporting that the worker finished"""
+        self._log_timer.stop()
+        self._flush_log()
+        self.main_window.finish_operation(success, message)
+    
     @property
     def ffmpeg_path(self):
         return self.main_window.ffmpeg_path
@@ -18,25 +103,110 @@ class VideoOperations:
     def ytdlp_path(self):
         return self.main_window.ytdlp_path
     
+    def start_hw_encoder_probe(self):
+        """Probe the current ffmpeg's hardware encoders on a background thread;
+        the probe can take several test encodes, so it never runs on the GUI thread"""
+        ffmpeg_path = self.ffmpeg_path
+        if not ffmpeg_path or ffmpeg_path in self._hw_encoders:
+            return
+        self._hw_encoders[ffmpeg_path] = self._HW_PROBE_PENDING
+        
+        def probe():
+            self._hw_encoders[ffmpeg_path] = self._probe_hw_encoder(ffmpeg_path)
+        
+        threading.Thread(target=probe, daemon=True).start()
+    
+    @property
+    def hw_encoder(self):
+        """Get the first working hardware encoder as (name, flags), or None;
+        probed once per ffmpeg executable. Until the probe has finished this is
+        None, so an operation started early uses libx264 rather than waiting"""
+        self.start_hw_encoder_probe()
+        result = self._hw_encoders.get(self.ffmpeg_path)
+        return None if result is self._HW_PROBE_PENDING else result
+    
+    def _probe_hw_encoder(self, ffmpeg_path):
+        """Find the first hardware encoder that ffmpeg lists and can actually open"""
+        try:
+            listed = subprocess.run([ffmpeg_path, "-hide_banner", "-encoders"],
+                                    capture_output=True, text=True, timeout=self._PROBE_TIMEOUT).stdout
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        for name, flags in self._HW_ENCODERS:
+            if name not in listed:
+                continue
+            # Builds list encoders whose device or driver is missing; try a tiny encode
+            test_cmd = [
+                ffmpeg_path, "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+                "-c:v", name, *flags, "-f", "null", "-"
+            ]
+            try:
+                if subprocess.run(test_cmd, capture_output=True, timeout=self._PROBE_TIMEOUT).returncode == 0:
+                    return name, flags
+            except (OSError, subprocess.TimeoutExpired):
+                # A hung driver counts as unusable
+                continue
+        return None
+    
+    def _logo_detector(self):
+        """Get the logo detector, creating it on first use (loading the OCR
+        models is slow); raises ImportError if its packages are missing"""
+        if self._detector is None or self._detector.ffmpeg_path != self.ffmpeg_path:
+            # Imported here so cv2 and the OCR engines only load when needed
+            from logo_detector import LogoDetector
+            self._detector = LogoDetector(self.ffmpeg_path)
+        return self._detector
+    
+    def _use_hw(self):
+        """Check whether flip/convert should encode on the hardware encoder"""
+        return self.use_hw_encoder and self.hw_encoder is not None
+    
+    def _folder_jobs(self, file_count=None):
+        """Get how many ffmpeg processes a folder operation on file_count files runs at once"""
+        jobs = self.folder_jobs or FOLDER_JOBS
+        if self._use_hw():
+            jobs = min(jobs, self._HW_FOLDER_JOBS)
+        # No idle slots: with fewer files than jobs each encode gets more threads
+        return max(1, min(jobs, file_count)) if file_count else jobs
+    
+    def _encode_flags(self, jobs=1):
+        """Get the H.264 encoder flags: the hardware encoder when one works, else
+        libx264 with the thread budget shared across parallel jobs"""
+        if self._use_hw():
+            name, flags = self.hw_encoder
+            return ["-c:v", name, *flags]
+        threads = max(1, self.encode_threads // jobs) if self.encode_threads else 0
+        return ["-c:v", "libx264", "-preset", self.encode_preset, "-crf", "23", "-threads", str(threads)]
+    
+    def _logo_encode_flags(self):
+        """Get the encoder flags for logo removal: the hardware encoder when one
+        works, else libx264 at the removal operations' usual quality"""
+        return self._encode_flags() if self._use_hw() else LOGO_ENCODE_FLAGS
+    
     def download_video(self):
         """Download video from URL"""
         if not self.ytdlp_path:
             self.main_window.show_error("yt-dlp executable not found. Cannot download.")
             return
 
-        url = self.main_window.url_input.text().strip()
-        if not url:
+        # Several URLs can be pasted separated by spaces; duplicates are fetched once
+        urls = list(dict.fromkeys(self.main_window.url_input.text().split()))
+        if not urls:
             self.main_window.log_message("Please enter a valid URL.")
             return
 
         save_path = self.main_window.download_folder if self.main_window.download_folder else "."
         
-        self.main_window.start_operation("Downloading Video")
-        
         # Create and start worker thread
-        self.main_window.worker_thread = WorkerThread("download", self.ytdlp_path, url, save_path)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+        if len(urls) == 1:
+            self.main_window.start_operation("Downloading Video")
+            self.main_window.worker_thread = WorkerThread("download", self.ytdlp_path, urls[0], save_path)
+        else:
+            self.main_window.start_operation(f"Downloading {len(urls)} Videos")
+            self.main_window.worker_thread = WorkerThread("download_batch", self.ytdlp_path, urls, save_path)
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
 
     def flip_video(self):
@@ -50,29 +220,36 @@ class VideoOperations:
             self.main_window.log_message("No video file selected.")
             return
 
-        if not os.path.isfile(file_path):
-            self.main_window.show_error("Selected video file does not exist.")
-            return
-
         # Let user choose flip direction
-        flip_options = ["Horizontal (hflip)", "Vertical (vflip)", "Both (hflip,vflip)"]
-        flip_choice, ok = QInputDialog.getItem(self.main_window, "Select Flip Direction", 
-                                              "Choose how to flip the video:", 
-                                              flip_options, 0, False)
-        if not ok:
-            self.main_window.log_message("Flip operation cancelled.")
+        flip_choice = self._ask_flip_direction("Choose how to flip the video:")
+        if flip_choice is None:
             return
 
         # Map choice to ffmpeg filter
         filter_param, suffix = self._get_flip_params(flip_choice)
-        output_path = file_path.rsplit(".", 1)[0] + suffix + ".mp4"
+        output_path = self._output_path(file_path, suffix)
+
+        # Flipping both ways is a 180° rotation, which the container can record
+        # as a display tag instead of re-encoding every frame
+        metadata_only = False
+        if filter_param == "hflip,vflip":
+            flip_modes = ["Fast (rotation tag only, no re-encode; some players ignore it)",
+                          "Re-encode (displays flipped everywhere)"]
+            mode_choice, ok = QInputDialog.getItem(self.main_window, "Select Flip Mode", 
+                                                  "Choose how to apply the flip:", 
+                                                  flip_modes, 0, False)
+            if not ok:
+                self.main_window.log_message("Flip operation cancelled.")
+                return
+            metadata_only = mode_choice == flip_modes[0]
         
         self.main_window.start_operation("Flipping Video")
         
         # Create and start worker thread
-        self.main_window.worker_thread = WorkerThread("flip", self.ffmpeg_path, file_path, filter_param, output_path, flip_choice)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+        self.main_window.worker_thread = WorkerThread("flip", self.ffmpeg_path, file_path, filter_param, output_path, flip_choice,
+                                                     self._encode_flags(), metadata_only)
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
 
     def flip_folder_videos(self):
@@ -87,12 +264,8 @@ class VideoOperations:
             return
 
         # Let user choose flip direction
-        flip_options = ["Horizontal (hflip)", "Vertical (vflip)", "Both (hflip,vflip)"]
-        flip_choice, ok = QInputDialog.getItem(self.main_window, "Select Flip Direction", 
-                                              "Choose how to flip all videos:", 
-                                              flip_options, 0, False)
-        if not ok:
-            self.main_window.log_message("Flip operation cancelled.")
+        flip_choice = self._ask_flip_direction("Choose how to flip all videos:")
+        if flip_choice is None:
             return
 
         # Map choice to ffmpeg filter and suffix
@@ -100,6 +273,9 @@ class VideoOperations:
 
         # Find video files
         video_files = self._find_video_files(folder_path)
+        if not video_files:
+            # Nothing at the top level: look through the subfolders too
+            video_files = self._find_video_files(folder_path, recursive=True)
         if not video_files:
             self.main_window.log_message("No video files found in the selected folder.")
             return
@@ -108,12 +284,14 @@ class VideoOperations:
         output_folder = os.path.join(folder_path, f"flipped_videos_{suffix[1:]}")  # Remove underscore from suffix
         os.makedirs(output_folder, exist_ok=True)
         
+        jobs = self._folder_jobs(len(video_files))
         self.main_window.start_operation(f"Flipping {len(video_files)} Videos")
         
         # Create and start worker thread
-        self.main_window.worker_thread = WorkerThread("flip_folder", self.ffmpeg_path, video_files, filter_param, output_folder, suffix)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+        self.main_window.worker_thread = WorkerThread("flip_folder", self.ffmpeg_path, video_files, folder_path, filter_param, output_folder, suffix,
+                                                     self._encode_flags(jobs), jobs)
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
 
     def split_video(self):
@@ -127,25 +305,45 @@ class VideoOperations:
             self.main_window.log_message("No video file selected.")
             return
 
-        if not os.path.isfile(file_path):
-            self.main_window.show_error("Selected video file does not exist.")
-            return
-
         # Let user choose split duration
         segment_time, duration_name = self._get_split_duration()
         if segment_time is None:
             return
 
-        output_folder = file_path.rsplit(".", 1)[0] + f"_parts_{duration_name}"
-        os.makedirs(output_folder, exist_ok=True)
+        # Stream copy is near-instant but can only cut on keyframes
+        split_modes = ["Fast (stream copy, cuts at keyframes)", "Exact (re-encode, slower)"]
+        mode_choice, ok = QInputDialog.getItem(self.main_window, "Select Split Mode", 
+                                              "Choose how to cut the parts:", 
+                                              split_modes, 0, False)
+        if not ok:
+            self.main_window.log_message("Split operation cancelled.")
+            return
+        stream_copy = mode_choice == split_modes[0]
+
+        output_folder = os.path.splitext(file_path)[0] + f"_parts_{duration_name}"
+        try:
+            os.makedirs(output_folder, exist_ok=True)
+        except OSError as e:
+            self.main_window.show_error(f"Cannot create output folder: {e}")
+            return
         output_pattern = os.path.join(output_folder, "part_%03d.mp4")
 
         self.main_window.start_operation(f"Splitting Video ({duration_name} parts)")
         
         # Create and start worker thread
-        self.main_window.worker_thread = WorkerThread("split", self.ffmpeg_path, file_path, segment_time, output_pattern)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+        if stream_copy:
+            self.main_window.worker_thread = WorkerThread("split", self.ffmpeg_path, file_path, segment_time, output_pattern, True)
+        else:
+            # Exact parts are independent encodes, so they run in parallel like the
+            # folder jobs; size the pool (and so each encode's thread share) by the
+            # number of parts when the duration is known; the worker reuses that count
+            metadata = self._get_video_metadata(file_path)
+            total_parts = -int(-metadata['duration'] // segment_time) if metadata and metadata['duration'] else None
+            jobs = self._folder_jobs(total_parts)
+            self.main_window.worker_thread = WorkerThread("split_parallel", self.ffmpeg_path, file_path, segment_time, output_pattern,
+                                                         total_parts, self._encode_flags(jobs), jobs)
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
 
     def convert_to_reel(self):
@@ -161,16 +359,21 @@ class VideoOperations:
 
         # Find video files
         video_files = self._find_video_files(folder_path)
+        if not video_files:
+            # Nothing at the top level: look through the subfolders too
+            video_files = self._find_video_files(folder_path, recursive=True)
         if not video_files:
             self.main_window.log_message("No video files found in the selected folder.")
             return
 
+        jobs = self._folder_jobs(len(video_files))
         self.main_window.start_operation(f"Converting {len(video_files)} Videos to TikTok/Reel")
         
         # Create and start worker thread
-        self.main_window.worker_thread = WorkerThread("convert", self.ffmpeg_path, video_files, folder_path)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+        self.main_window.worker_thread = WorkerThread("convert", self.ffmpeg_path, video_files,
+                                                     self._encode_flags(jobs), jobs)
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
 
     def remove_logo(self):
@@ -184,10 +387,6 @@ class VideoOperations:
             self.main_window.log_message("No video file selected.")
             return
 
-        if not os.path.isfile(file_path):
-            self.main_window.show_error("Selected video file does not exist.")
-            return
-
         # Ask user if they want automatic detection or manual positioning
         detection_options = [
             "🤖 Automatic detection (AI finds logos)",
@@ -211,11 +410,8 @@ class VideoOperations:
         self.main_window.log_message("🔍 Analyzing video for logos with timeline tracking...")
         
         try:
-            # Import logo detection (only when needed)
-            from logo_detector import LogoDetector
-            
-            # Create detector and analyze with timeline
-            detector = LogoDetector(self.ffmpeg_path)
+            # Analyze with timeline
+            detector = self._logo_detector()
             watermark_timelines = detector.detect_logos_with_timeline(file_path, sample_interval=2.0)
             
             if not watermark_timelines:
@@ -225,17 +421,17 @@ class VideoOperations:
             # Filter out excessive detections (likely false positives)
             if len(watermark_timelines) > 50:
                 self.main_window.log_message(f"⚠️ Found {len(watermark_timelines)} detections - filtering to top candidates...")
-                # Sort by confidence and watermark indicators, take top 10
-                watermark_timelines.sort(key=lambda t: (
+                # Rank by confidence and watermark indicators, keep the top 10
+                watermark_timelines = heapq.nlargest(10, watermark_timelines, key=lambda t: (
                     t.get('confidence', 0) * (2.0 if t.get('is_watermark', False) else 1.0),
                     len(t.get('positions', []))
-                ), reverse=True)
-                watermark_timelines = watermark_timelines[:10]
+                ))
                 self.main_window.log_message(f"📊 Filtered to {len(watermark_timelines)} most likely watermarks")
             
             self.main_window.log_message(f"✅ Found {len(watermark_timelines)} watermark timelines to remove")
             
-            # Analyze each watermark timeline  
+            # Analyze each watermark timeline, logging the summary as one entry
+            lines = []
             for i, timeline in enumerate(watermark_timelines[:5]):  # Show only top 5
                 is_moving = timeline.get('is_moving', False)
                 position_count = len(timeline.get('positions', []))
@@ -247,10 +443,11 @@ class VideoOperations:
                 watermark_icon = "💧" if is_watermark else ""
                 movement_text = f"({position_count} positions)" if is_moving else "(consistent position)"
                 
-                self.main_window.log_message(f"{status_icon} {watermark_icon}'{text}' - conf: {confidence:.2f} {movement_text}")
+                lines.append(f"{status_icon} {watermark_icon}'{text}' - conf: {confidence:.2f} {movement_text}")
             
             if len(watermark_timelines) > 5:
-                self.main_window.log_message(f"... and {len(watermark_timelines) - 5} more watermarks")
+                lines.append(f"... and {len(watermark_timelines) - 5} more watermarks")
+            self.main_window.log_message("\n".join(lines))
             
             # Remove watermarks based on their movement characteristics
             self._remove_timeline_watermarks(file_path, watermark_timelines)
@@ -291,15 +488,16 @@ class VideoOperations:
             self.main_window.log_message("🎯 Standard detection - using Blur method")
         
         method_type = self._get_logo_removal_method(method_choice)
-        output_path = file_path.rsplit(".", 1)[0] + f"_logo_removed_auto.mp4"
+        output_path = self._output_path(file_path, "_logo_removed_auto")
         
         self.main_window.start_operation(f"Auto-Removing Logo ({method_choice})")
         
         # Create and start worker thread
         self.main_window.worker_thread = WorkerThread("remove_logo", self.ffmpeg_path, file_path, 
-                                                     method_type, selected_logo, output_path)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+                                                     method_type, selected_logo, output_path,
+                                                     self._logo_encode_flags())
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
     
     def _remove_moving_watermarks(self, file_path, detected_logos):
@@ -318,49 +516,85 @@ class VideoOperations:
     
     def _group_watermarks_by_position(self, watermarks):
         """Group watermarks that are in similar positions"""
-        groups = []
+        groups = []  # [sum_x, sum_y, members, cell]; the centroid is sum / len(members)
         threshold = 100  # pixels threshold for grouping
+        # Groups indexed by the threshold-sized grid cell holding their centroid:
+        # a centroid closer than threshold is at most one cell away, so only the
+        # 3x3 cells around a watermark need checking
+        cells = {}
+        
+        def move_to_cell(index, cell):
+            group = groups[index]
+            if group[3] is not None:
+                cells[group[3]].remove(index)
+            group[3] = cell
+            cells.setdefault(cell, []).append(index)
         
         for watermark in watermarks:
             x, y = watermark['x'], watermark['y']
+            cx, cy = int(x // threshold), int(y // threshold)
             
-            # Find if this watermark belongs to an existing group
+            # Find if this watermark belongs to an existing group; the
+            # earliest created group that is close enough wins
+            candidates = sorted(index for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                                for index in cells.get((cx + dx, cy + dy), ()))
             found_group = False
-            for group in groups:
-                group_x = sum(w['x'] for w in group) / len(group)
-                group_y = sum(w['y'] for w in group) / len(group)
+            for index in candidates:
+                group = groups[index]
+                members = group[2]
+                group_x = group[0] / len(members)
+                group_y = group[1] / len(members)
                 
                 if abs(x - group_x) < threshold and abs(y - group_y) < threshold:
-                    group.append(watermark)
+                    group[0] += x
+                    group[1] += y
+                    members.append(watermark)
+                    cell = (int(group[0] / len(members) // threshold), int(group[1] / len(members) // threshold))
+                    if cell != group[3]:
+                        move_to_cell(index, cell)
                     found_group = True
                     break
             
             if not found_group:
-                groups.append([watermark])
+                groups.append([x, y, [watermark], None])
+                move_to_cell(len(groups) - 1, (cx, cy))
         
-        return groups
+        return [group[2] for group in groups]
     
     def _remove_single_moving_watermark(self, file_path, watermark_group):
         """Remove a single watermark that moves position"""
         self.main_window.log_message(f"🎯 Removing moving watermark (found in {len(watermark_group)} positions)")
         
-        # Calculate average position and create a larger removal area
-        avg_x = sum(w['x'] for w in watermark_group) / len(watermark_group)
-        avg_y = sum(w['y'] for w in watermark_group) / len(watermark_group)
-        max_w = max(w['width'] for w in watermark_group)
-        max_h = max(w['height'] for w in watermark_group)
+        # Bounds of the positions and the largest size, in one pass over the group
+        first = watermark_group[0]
+        min_x = max_x = first['x']
+        min_y = max_y = first['y']
+        max_w, max_h, max_conf = first['width'], first['height'], first['confidence']
+        for w in watermark_group[1:]:
+            x, y = w['x'], w['y']
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+            max_w = max(max_w, w['width'])
+            max_h = max(max_h, w['height'])
+            max_conf = max(max_conf, w['confidence'])
         
         # Create enlarged area to cover movement
-        x_range = max(w['x'] for w in watermark_group) - min(w['x'] for w in watermark_group)
-        y_range = max(w['y'] for w in watermark_group) - min(w['y'] for w in watermark_group)
+        x_range = max_x - min_x
+        y_range = max_y - min_y
         
         # Expand the removal area to cover the full movement range
         expanded_watermark = {
-            'x': int(min(w['x'] for w in watermark_group) - 10),
-            'y': int(min(w['y'] for w in watermark_group) - 10),
+            'x': int(min_x - 10),
+            'y': int(min_y - 10),
             'width': int(max_w + x_range + 20),
             'height': int(max_h + y_range + 20),
-            'confidence': max(w['confidence'] for w in watermark_group),
+            'confidence': max_conf,
             'type': 'moving_watermark',
             'corner': 'moving_area'
         }
@@ -370,15 +604,16 @@ class VideoOperations:
         # Use inpainting method for moving watermarks (works better than delogo)
         method_choice = "Smart inpaint (recommended for text)"
         method_type = "inpaint"
-        output_path = file_path.rsplit(".", 1)[0] + f"_moving_watermark_removed.mp4"
+        output_path = self._output_path(file_path, "_moving_watermark_removed")
         
         self.main_window.start_operation("Removing Moving Watermark")
         
         # Create and start worker thread
         self.main_window.worker_thread = WorkerThread("remove_logo", self.ffmpeg_path, file_path, 
-                                                     method_type, expanded_watermark, output_path)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+                                                     method_type, expanded_watermark, output_path,
+                                                     self._logo_encode_flags())
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
     
     def _remove_multiple_watermarks(self, file_path, watermark_groups):
@@ -395,19 +630,19 @@ class VideoOperations:
         # Sort by confidence (highest first)
         all_watermarks.sort(key=lambda w: w['confidence'], reverse=True)
         
-        self.main_window.log_message(f"📋 Watermarks to remove:")
+        lines = ["📋 Watermarks to remove:"]
         for i, watermark in enumerate(all_watermarks):
             text = watermark.get('text', 'unknown')[:20] + ('...' if len(watermark.get('text', '')) > 20 else '')
-            self.main_window.log_message(f"  {i+1}. '{text}' at ({watermark['x']}, {watermark['y']}) conf: {watermark['confidence']:.3f}")
+            lines.append(f"  {i+1}. '{text}' at ({watermark['x']}, {watermark['y']}) conf: {watermark['confidence']:.3f}")
+        self.main_window.log_message("\n".join(lines))
         
         # Strategy: Create a combined filter that removes all watermarks in one pass
         if len(all_watermarks) <= 3:
             # For small numbers of watermarks, use combined removal
             self._remove_combined_watermarks(file_path, all_watermarks)
         else:
-            # For many watermarks, remove the most confident one first
-            self.main_window.log_message(f"🎯 Too many watermarks ({len(all_watermarks)}), removing highest confidence first")
-            self._remove_single_watermark(file_path, all_watermarks[0])
+            # Their bounding box would cover most of the frame; delogo each area instead
+            self._remove_watermarks_delogo_chain(file_path, all_watermarks)
     
     def _remove_combined_watermarks(self, file_path, watermarks):
         """Remove multiple watermarks in a single pass using combined filters"""
@@ -442,15 +677,32 @@ class VideoOperations:
         
         # Use inpainting method for combined removal
         method_type = "inpaint"
-        output_path = file_path.rsplit(".", 1)[0] + f"_combined_watermarks_removed.mp4"
+        output_path = self._output_path(file_path, "_combined_watermarks_removed")
         
         self.main_window.start_operation("Removing Combined Watermarks")
         
         # Create and start worker thread
         self.main_window.worker_thread = WorkerThread("remove_logo", self.ffmpeg_path, file_path, 
-                                                     method_type, combined_watermark, output_path)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+                                                     method_type, combined_watermark, output_path,
+                                                     self._logo_encode_flags())
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
+        self.main_window.worker_thread.start()
+    
+    def _remove_watermarks_delogo_chain(self, file_path, watermarks):
+        """Remove many separate watermarks in a single pass with one delogo filter each"""
+        self.main_window.log_message(f"🎯 Removing {len(watermarks)} watermarks with chained delogo filters")
+        
+        output_path = self._output_path(file_path, "_watermarks_removed")
+        
+        self.main_window.start_operation(f"Removing {len(watermarks)} Watermarks")
+        
+        # Create and start worker thread
+        self.main_window.worker_thread = WorkerThread("multi_delogo", self.ffmpeg_path, file_path, 
+                                                     watermarks, output_path,
+                                                     self._logo_encode_flags())
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
     
     def _remove_logo_manual(self, file_path):
@@ -461,21 +713,22 @@ class VideoOperations:
             return
 
         # Get logo position from user
-        logo_position = self._get_logo_position()
+        logo_position = self._get_logo_position(file_path)
         if logo_position is None:
             return
 
         # Map choice to processing method
         method_type = self._get_logo_removal_method(method_choice)
-        output_path = file_path.rsplit(".", 1)[0] + f"_logo_removed_manual.mp4"
+        output_path = self._output_path(file_path, "_logo_removed_manual")
         
         self.main_window.start_operation(f"Removing Logo ({method_choice})")
         
         # Create and start worker thread
         self.main_window.worker_thread = WorkerThread("remove_logo", self.ffmpeg_path, file_path, 
-                                                     method_type, logo_position, output_path)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+                                                     method_type, logo_position, output_path,
+                                                     self._logo_encode_flags())
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
     
     def _get_logo_removal_method_choice(self):
@@ -497,6 +750,29 @@ class VideoOperations:
             return None
         return method_choice
 
+    def _ask_flip_direction(self, prompt):
+        """Get the flip direction from the user, preselecting their last choice"""
+        settings = QSettings("mmo", "video_tool")
+        last_index = settings.value("flip/last_direction", 0, type=int)
+        if not 0 <= last_index < len(self._FLIP_OPTIONS):
+            last_index = 0
+        
+        flip_choice, ok = QInputDialog.getItem(self.main_window, "Select Flip Direction", 
+                                              prompt, self._FLIP_OPTIONS, last_index, False)
+        if not ok:
+            self.main_window.log_message("Flip operation cancelled.")
+            return None
+        settings.setValue("flip/last_direction", self._FLIP_OPTIONS.index(flip_choice))
+        return flip_choice
+
+    def _output_path(self, src, suffix, ext=".mp4"):
+        """Build the output path next to src, never returning src itself"""
+        base, _ = os.path.splitext(src)
+        output_path = f"{base}{suffix}{ext}"
+        if os.path.abspath(output_path) == os.path.abspath(src):
+            output_path = f"{base}{suffix}.out{ext}"
+        return output_path
+
     def _get_flip_params(self, flip_choice):
         """Get ffmpeg filter parameters for flip choice"""
         if flip_choice == "Horizontal (hflip)":
@@ -508,17 +784,7 @@ class VideoOperations:
 
     def _get_split_duration(self):
         """Get split duration from user input"""
-        duration_options = [
-            "1 minute (60 seconds)",
-            "2 minutes (120 seconds)",
-            "3 minutes (180 seconds)",
-            "5 minutes (300 seconds)",
-            "10 minutes (600 seconds)", 
-            "15 minutes (900 seconds)",
-            "20 minutes (1200 seconds)",
-            "30 minutes (1800 seconds)",
-            "Custom duration"
-        ]
+        duration_options = self._DURATION_LABELS
         
         duration_choice, ok = QInputDialog.getItem(self.main_window, "Select Split Duration", 
                                                   "Choose how long each part should be:", 
@@ -527,20 +793,11 @@ class VideoOperations:
             self.main_window.log_message("Split operation cancelled.")
             return None, None
 
-        # Get the duration in seconds
-        duration_map = {
-            "1 minute (60 seconds)": (60, "1min"),
-            "2 minutes (120 seconds)": (120, "2min"),
-            "3 minutes (180 seconds)": (180, "3min"),
-            "5 minutes (300 seconds)": (300, "5min"),
-            "10 minutes (600 seconds)": (600, "10min"),
-            "15 minutes (900 seconds)": (900, "15min"),
-            "20 minutes (1200 seconds)": (1200, "20min"),
-            "30 minutes (1800 seconds)": (1800, "30min")
-        }
-        
-        if duration_choice in duration_map:
-            return duration_map[duration_choice]
+        # Preset entries come first, in _SPLIT_DURATIONS order
+        choice_index = duration_options.index(duration_choice)
+        if choice_index < len(self._SPLIT_DURATIONS):
+            _, seconds, duration_name = self._SPLIT_DURATIONS[choice_index]
+            return seconds, duration_name
         else:  # Custom duration
             # Enhanced custom duration input with decimal support
             while True:  # Loop until valid input or cancel
@@ -588,22 +845,50 @@ class VideoOperations:
                     self.main_window.show_error("Invalid input. Please enter a valid number (e.g., 1, 2.5, 0.5).")
                     continue  # Ask for input again
 
-    def _find_video_files(self, folder_path):
-        """Find all video files in a folder"""
-        video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v'}
+    def _find_video_files(self, folder_path, recursive=False):
+        """Find all video files in a folder (and its subfolders if recursive)"""
+        if recursive:
+            return self._walk_video_files(folder_path)
         
-        video_files = []
-        for filename in os.listdir(folder_path):
-            file_path = os.path.join(folder_path, filename)
-            if os.path.isfile(file_path):
-                _, ext = os.path.splitext(filename.lower())
-                if ext in video_extensions:
-                    video_files.append(file_path)
+        # Adding, removing or renaming an entry bumps the folder's mtime
+        mtime_ns = os.stat(folder_path).st_mtime_ns
+        cached = self._scan_cache.get(folder_path)
+        if cached and cached[0] == mtime_ns:
+            return list(cached[1])
         
+        video_files = []
+        # scandir reports the entry type without a stat() per file on most filesystems
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                name = entry.name
+                dot = name.rfind('.')
+                if dot > 0 and name[dot + 1:].lower() in self._VIDEO_EXTS and entry.is_file():
+                    video_files.append(entry.path)
+        
+        self._scan_cache[folder_path] = (mtime_ns, tuple(video_files))
         return video_files
 
-    def _get_logo_position(self):
-        """Get logo position and size from user"""
+    def _walk_video_files(self, folder_path):
+        """Find video files below a folder, pruning hidden, system and output folders"""
+        video_files = []
+        for dir_path, dir_names, file_names in os.walk(folder_path):
+            # Pruning in place stops os.walk from descending into skipped folders
+            dir_names[:] = [d for d in dir_names if not self._is_skipped_dir(d)]
+            for name in file_names:
+                dot = name.rfind('.')
+                if dot > 0 and name[dot + 1:].lower() in self._VIDEO_EXTS:
+                    video_files.append(os.path.join(dir_path, name))
+        return video_files
+
+    def _is_skipped_dir(self, name):
+        """Check whether a recursive scan should skip a folder"""
+        return (name.startswith('.') or name in self._SKIP_DIRS
+                or name.startswith(self._OUTPUT_DIR_PREFIXES)
+                or name.endswith(self._OUTPUT_DIR_SUFFIXES)
+                or self._PARTS_DIR_RE.fullmatch(name) is not None)
+
+    def _get_logo_position(self, file_path):
+        """Get logo position and size in file_path's frame from user"""
         # Ask for logo position
         position_options = [
             "Top-left corner",
@@ -661,16 +946,21 @@ class VideoOperations:
                     self.main_window.show_error("Please enter exactly 2 values: width,height")
                     return None
                 
-                # Calculate position based on choice
-                position_map = {
-                    "Top-left corner": {"x": 10, "y": 10},
-                    "Top-right corner": {"x": f"main_w-{size[0]}-10", "y": 10},
-                    "Bottom-left corner": {"x": 10, "y": f"main_h-{size[1]}-10"},
-                    "Bottom-right corner": {"x": f"main_w-{size[0]}-10", "y": f"main_h-{size[1]}-10"}
-                }
-                
-                pos = position_map[position_choice]
-                return {"x": pos["x"], "y": pos["y"], "width": size[0], "height": size[1]}
+                # Calculate position based on choice, 10px in from the chosen corner.
+                # The workers need pixel values, so right/bottom corners are
+                # resolved against the probed frame size
+                width, height = size
+                if position_choice == "Top-left corner":
+                    x, y = 10, 10
+                else:
+                    video_width, video_height = self._get_video_dimensions(file_path)
+                    if position_choice == "Top-right corner":
+                        x, y = video_width - width - 10, 10
+                    elif position_choice == "Bottom-left corner":
+                        x, y = 10, video_height - height - 10
+                    else:  # Bottom-right corner
+                        x, y = video_width - width - 10, video_height - height - 10
+                return {"x": x, "y": y, "width": width, "height": height}
                 
             except ValueError:
                 self.main_window.show_error("Invalid size. Please enter numbers only.")
@@ -699,16 +989,15 @@ class VideoOperations:
             # Multiple watermarks - select the best candidate
             self.main_window.log_message(f"🎯 Processing {len(watermark_timelines)} different watermarks")
             
-            # Sort by priority: watermark indicators, confidence, and number of detections
-            sorted_timelines = sorted(watermark_timelines, 
-                                    key=lambda t: (
-                                        t.get('is_watermark', False),  # Prioritize actual watermarks
-                                        t.get('confidence', 0),        # Then by confidence
-                                        len(t.get('positions', []))    # Then by consistency
-                                    ), reverse=True)
+            # Pick the top priority: watermark indicators, confidence, and number of detections
+            best_timeline = max(watermark_timelines,
+                                key=lambda t: (
+                                    t.get('is_watermark', False),  # Prioritize actual watermarks
+                                    t.get('confidence', 0),        # Then by confidence
+                                    len(t.get('positions', []))    # Then by consistency
+                                ))
             
             # Show user what we're targeting
-            best_timeline = sorted_timelines[0]
             text = best_timeline.get('text', 'Unknown')[:30]
             confidence = best_timeline.get('confidence', 0)
             is_watermark = best_timeline.get('is_watermark', False)
@@ -746,8 +1035,7 @@ class VideoOperations:
         
         # Import the logo detector for dynamic command generation
         try:
-            from logo_detector import LogoDetector
-            detector = LogoDetector(self.ffmpeg_path)
+            detector = self._logo_detector()
             
             # Generate dynamic removal command
             dynamic_cmd = detector.create_dynamic_removal_command(file_path, watermark_timeline, method='blur')
@@ -755,14 +1043,14 @@ class VideoOperations:
             if dynamic_cmd:
                 self.main_window.log_message("🎯 Using dynamic time-based removal with FFmpeg")
                 
-                output_path = file_path.rsplit(".", 1)[0] + f"_moving_removed.mp4"
+                output_path = self._output_path(file_path, "_moving_removed")
                 
                 self.main_window.start_operation("Removing Moving Watermark (Dynamic)")
                 
                 # Create and start worker thread with dynamic command
                 self.main_window.worker_thread = WorkerThread("dynamic_removal", dynamic_cmd, output_path)
-                self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-                self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+                self.main_window.worker_thread.progress.connect(self._enqueue_log)
+                self.main_window.worker_thread.finished.connect(self._finish_operation)
                 self.main_window.worker_thread.start()
                 
                 return
@@ -783,11 +1071,16 @@ class VideoOperations:
         
         self.main_window.log_message(f"🎯 Using expanded area method for moving watermark '{text}'")
         
-        # Calculate expanded area covering all positions
-        min_x = min(p['x'] for p in positions)
-        min_y = min(p['y'] for p in positions)
-        max_x = max(p['x'] + p['width'] for p in positions)
-        max_y = max(p['y'] + p['height'] for p in positions)
+        # Calculate expanded area covering all positions, in one pass
+        first = positions[0]
+        min_x, min_y = first['x'], first['y']
+        max_x, max_y = min_x + first['width'], min_y + first['height']
+        for p in positions[1:]:
+            x, y = p['x'], p['y']
+            min_x = min(min_x, x)
+            min_y = min(min_y, y)
+            max_x = max(max_x, x + p['width'])
+            max_y = max(max_y, y + p['height'])
         
         # Add padding for better coverage
         padding = 15
@@ -816,15 +1109,16 @@ class VideoOperations:
         
         # Use inpainting method for better results on moving watermarks
         method_type = "inpaint"
-        output_path = file_path.rsplit(".", 1)[0] + f"_moving_removed.mp4"
+        output_path = self._output_path(file_path, "_moving_removed")
         
         self.main_window.start_operation("Removing Moving Watermark (Expanded Area)")
         
         # Create and start worker thread
         self.main_window.worker_thread = WorkerThread("remove_logo", self.ffmpeg_path, file_path, 
-                                                     method_type, expanded_watermark, output_path)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+                                                     method_type, expanded_watermark, output_path,
+                                                     self._logo_encode_flags())
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
     
     def _remove_static_timeline_watermark(self, file_path, watermark_timeline):
@@ -864,25 +1158,27 @@ class VideoOperations:
         self.main_window.log_message(f"📍 Removing static watermark '{text}' at ({x}, {y}) size {w}x{h}")
         
         # Choose optimal removal method - prefer delogo for better results
-        if watermark_timeline.get('is_watermark', False) or any(indicator in text.lower() for indicator in ['www', '.com', '©', '®', '™']):
+        text_lc = text.lower()
+        if watermark_timeline.get('is_watermark', False) or any(indicator in text_lc for indicator in self._WATERMARK_INDICATORS):
             method_type = "delogo"
             method_choice = "Remove with delogo filter"
-        elif 'text' in text.lower() or len(text) > 5:
+        elif 'text' in text_lc or len(text) > 5:
             method_type = "inpaint"
             method_choice = "Smart inpaint (recommended for text)"
         else:
             method_type = "blur"
             method_choice = "Blur logo area"
         
-        output_path = file_path.rsplit(".", 1)[0] + f"_static_removed.mp4"
+        output_path = self._output_path(file_path, "_static_removed")
         
         self.main_window.start_operation(f"Removing Static Watermark ({method_choice})")
         
         # Create and start worker thread
         self.main_window.worker_thread = WorkerThread("remove_logo", self.ffmpeg_path, file_path, 
-                                                     method_type, legacy_watermark, output_path)
-        self.main_window.worker_thread.progress.connect(self.main_window.log_message)
-        self.main_window.worker_thread.finished.connect(self.main_window.finish_operation)
+                                                     method_type, legacy_watermark, output_path,
+                                                     self._logo_encode_flags())
+        self.main_window.worker_thread.progress.connect(self._enqueue_log)
+        self.main_window.worker_thread.finished.connect(self._finish_operation)
         self.main_window.worker_thread.start()
     
     def _validate_coordinates(self, x, y, w, h, video_width, video_height):
@@ -903,17 +1199,39 @@ class VideoOperations:
         
         return x, y, w, h
     
-    def _get_video_dimensions(self, video_path):
-        """Get video dimensions using ffprobe"""
+    def _get_video_metadata(self, video_path):
+        """Get the first video stream's width and height plus the container
+        duration from one ffprobe call, cached until the file changes; None if
+        the file cannot be probed"""
+        try:
+            st = os.stat(video_path)
+        except OSError:
+            return None
+        cache_key = (os.path.abspath(video_path), st.st_mtime_ns, st.st_size)
+        if cache_key in self._probe_cache:
+            return self._probe_cache[cache_key]
+        
+        probe_cmd = [
+            "ffprobe", "-v", "error", "-select_streams", "v:0",
+            "-show_entries", "stream=width,height:format=duration", "-of", "json", video_path
+        ]
         try:
-            probe_cmd = [
-                "ffprobe", "-v", "error", "-select_streams", "v:0", 
-                "-show_entries", "stream=width,height", "-of", "csv=p=0", video_path
-            ]
             probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
-            if probe_result.returncode == 0:
-                dimensions = probe_result.stdout.strip().split(',')
-                return int(dimensions[0]), int(dimensions[1])
-        except:
-            pass
+            info = json.loads(probe_result.stdout)
+            stream = info["streams"][0]
+            metadata = {
+                'width': int(stream['width']),
+                'height': int(stream['height']),
+                'duration': float(info.get('format', {}).get('duration', 0)),
+            }
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            return None
+        self._probe_cache[cache_key] = metadata
+        return metadata
+    
+    def _get_video_dimensions(self, video_path):
+        """Get video dimensions using ffprobe, cached until the file changes"""
+        metadata = self._get_video_metadata(video_path)
+        if metadata:
+            return metadata['width'], metadata['height']
         return 1920, 1080  # Default fallback
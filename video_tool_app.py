@@ -9,9 +9,23 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QTimer
 
-from ui_styles import APP_STYLE, STATUS_COLORS
+from ui_styles import StatusState, install_app_style, set_status
 from video_operations import VideoOperations
 
+# Executable lookups shared by every window; misses are not stored, so a tool
+# installed while the app is running is found by the next window
+_executables = {}
+
+
+def _find_executable(name):
+    """shutil.which(name), remembered for the rest of the session once found"""
+    path = _executables.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path:
+            _executables[name] = path
+    return path
+
 
 class VideoToolApp(QWidget):
     """Main application window for Video Tool Pro"""
@@ -38,10 +52,12 @@ class VideoToolApp(QWidget):
         self.timer.timeout.connect(self.update_elapsed_time)
 
         # Detect executables
-        self.ffmpeg_path = shutil.which("ffmpeg")
-        self.ytdlp_path = shutil.which("yt-dlp")
+        self.ffmpeg_path = _find_executable("ffmpeg")
+        self.ytdlp_path = _find_executable("yt-dlp")
 
-        if not self.ffmpeg_path:
+        if self.ffmpeg_path:
+            self.video_ops.start_hw_encoder_probe()
+        else:
             self.show_error("ffmpeg not found. Please install ffmpeg and make sure it is in your PATH.")
         if not self.ytdlp_path:
             self.show_error("yt-dlp not found. Please install yt-dlp and make sure it is in your PATH.")
@@ -208,7 +224,7 @@ class VideoToolApp(QWidget):
 
     def setup_styling(self):
         """Apply CSS styling"""
-        self.setStyleSheet(APP_STYLE)
+        install_app_style(self)
 
     def update_elapsed_time(self):
         """Update the elapsed time display"""
@@ -223,7 +239,7 @@ class VideoToolApp(QWidget):
         self.start_time = time.time()
         self.timer.start(1000)  # Update every second
         self.status_label.setText(f"🔄 {operation_name}...")
-        self.status_label.setStyleSheet(STATUS_COLORS['working'])
+        set_status(self.status_label, StatusState.WORKING)
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate progress
         self.set_buttons_enabled(False)
@@ -233,10 +249,10 @@ class VideoToolApp(QWidget):
         self.timer.stop()
         if success:
             self.status_label.setText("✅ Completed")
-            self.status_label.setStyleSheet(STATUS_COLORS['success'])
+            set_status(self.status_label, StatusState.SUCCESS)
         else:
             self.status_label.setText("❌ Failed")
-            self.status_label.setStyleSheet(STATUS_COLORS['error'])
+            set_status(self.status_label, StatusState.ERROR)
         
         self.progress_bar.setVisible(False)
         self.log_message(message)
@@ -248,7 +264,7 @@ class VideoToolApp(QWidget):
     def reset_status(self):
         """Reset status to ready"""
         self.status_label.setText("⏱️ Ready")
-        self.status_label.setStyleSheet(STATUS_COLORS['ready'])
+        set_status(self.status_label, StatusState.READY)
         self.elapsed_label.setText("Duration: 00:00")
 
     def set_buttons_enabled(self, enabled):
@@ -53,7 +53,9 @@ class VideoToolAppWithThemes(QWidget):
         self.ffmpeg_path = shutil.which("ffmpeg")
         self.ytdlp_path = shutil.which("yt-dlp")
 
-        if not self.ffmpeg_path:
+        if self.ffmpeg_path:
+            self.video_ops.start_hw_encoder_probe()
+        else:
             self.show_error("ffmpeg not found. Please install ffmpeg and make sure it is in your PATH.")
         if not self.ytdlp_path:
             self.show_error("yt-dlp not found. Please install yt-dlp and make sure it is in your PATH.")
@@ -1,8 +1,77 @@
 import subprocess
 import os
+import json
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
 import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
 
+# Folder operations run this many ffmpeg processes side by side. Each encode is
+# itself multithreaded, so half the cores is enough to keep the CPU busy.
+FOLDER_JOBS = max(1, (os.cpu_count() or 2) // 2)
+
+# Fragments yt-dlp downloads at once for DASH/HLS streams
+YTDLP_FRAGMENTS = 4
+
+# URLs a batch download fetches side by side, one yt-dlp process each
+DOWNLOAD_JOBS = 4
+
+# How much of the next queued input the kernel is asked to read ahead
+PREFETCH_BYTES = 64 * 1024 * 1024
+
+# Software encode used by the logo removal operations when no hardware encoder is in use
+LOGO_ENCODE_FLAGS = ["-c:v", "libx264", "-crf", "23", "-preset", "medium"]
+
+# Leading ffmpeg options for captured runs: only errors reach stderr, so a
+# failure message is just the error and no banner/stats output is piped
+FFMPEG_QUIET = ["-hide_banner", "-nostats", "-loglevel", "error"]
+
+# Minimum wall-clock seconds between ffmpeg progress lines in the log
+PROGRESS_INTERVAL = 2.0
+
+# POSIX launchers used to deprioritize and pin parallel folder jobs
+_NICE = shutil.which("nice")
+_TASKSET = shutil.which("taskset")
+
+
+def advise_file(path, advice, length=0):
+    """Give the kernel an access-pattern hint (an os.POSIX_FADV_* name) for a file.
+
+    A no-op where posix_fadvise is unavailable (Windows, macOS) or the file
+    cannot be opened; the hint only affects caching, never correctness.
+    """
+    advice = getattr(os, advice, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, length, advice)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def probe_rotation(path):
+    """Get the first video stream's display rotation in degrees counter-clockwise
+    (0-359, 0 if unrotated), or None if ffprobe cannot read the file"""
+    probe_cmd = ["ffprobe", "-v", "error", "-select_streams", "v:0", "-show_streams", "-of", "json", path]
+    try:
+        stream = json.loads(subprocess.run(probe_cmd, capture_output=True, text=True).stdout)["streams"][0]
+        for side_data in stream.get("side_data_list", ()):
+            if "rotation" in side_data:
+                return int(float(side_data["rotation"])) % 360
+        # Older ffprobe builds only report the rotate tag, which is clockwise
+        return -int(stream.get("tags", {}).get("rotate", 0)) % 360
+    except (OSError, ValueError, KeyError, IndexError, TypeError):
+        return None
+
 
 class WorkerThread(QThread):
     progress = pyqtSignal(str)  # For log messages
@@ -17,24 +86,35 @@ class WorkerThread(QThread):
         try:
             if self.operation_type == "download":
                 self.download_video_worker(*self.args)
+            elif self.operation_type == "download_batch":
+                self.download_batch_worker(*self.args)
             elif self.operation_type == "flip":
                 self.flip_video_worker(*self.args)
             elif self.operation_type == "flip_folder":
                 self.flip_folder_worker(*self.args)
             elif self.operation_type == "split":
                 self.split_video_worker(*self.args)
+            elif self.operation_type == "split_parallel":
+                self.split_parallel_worker(*self.args)
             elif self.operation_type == "convert":
                 self.convert_to_reel_worker(*self.args)
             elif self.operation_type == "remove_logo":
                 self.remove_logo_worker(*self.args)
+            elif self.operation_type == "multi_delogo":
+                self.multi_delogo_worker(*self.args)
             elif self.operation_type == "dynamic_removal":
                 self.dynamic_removal_worker(*self.args)
         except Exception as e:
             self.finished.emit(False, f"Error: {str(e)}")
     
+    def _download_cmd(self, ytdlp_path, url, save_path):
+        # "best" is a single pre-muxed format, so yt-dlp runs no ffmpeg merge
+        # afterwards; the time goes into fetching, so fetch fragments in parallel
+        return [ytdlp_path, "-f", "best", "--concurrent-fragments", str(YTDLP_FRAGMENTS), "-P", save_path, url]
+    
     def download_video_worker(self, ytdlp_path, url, save_path):
         self.progress.emit(f"Starting download for: {url}")
-        cmd = [ytdlp_path, "-f", "best", "-P", save_path, url]
+        cmd = self._download_cmd(ytdlp_path, url, save_path)
         self.progress.emit(f"Running command: {' '.join(cmd)}")
         
         result = subprocess.run(cmd, capture_output=True, text=True)
@@ -43,50 +123,185 @@ class WorkerThread(QThread):
         else:
             self.finished.emit(False, f"Download failed: {result.stderr}")
     
-    def flip_video_worker(self, ffmpeg_path, file_path, filter_param, output_path, flip_choice):
+    def download_batch_worker(self, ytdlp_path, urls, save_path, jobs=DOWNLOAD_JOBS):
+        """Download several URLs, up to `jobs` yt-dlp processes at a time"""
+        total = len(urls)
+        self.progress.emit(f"Starting {total} downloads, {min(jobs, total)} at a time...")
+        
+        def download(i, url):
+            self.progress.emit(f"[{i+1}/{total}] Downloading: {url}")
+            result = subprocess.run(self._download_cmd(ytdlp_path, url, save_path),
+                                    stdin=subprocess.DEVNULL, capture_output=True, text=True)
+            if result.returncode == 0:
+                self.progress.emit(f"[{i+1}/{total}] ✓ Done: {url}")
+                return True
+            self.progress.emit(f"[{i+1}/{total}] ✗ Failed: {url}: {result.stderr}")
+            return False
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(jobs, total))) as pool:
+            successful = sum(pool.map(download, range(total), urls))
+        self.finished.emit(successful == total, f"Downloads completed! Success: {successful}, Failed: {total - successful}")
+    
+    def flip_video_worker(self, ffmpeg_path, file_path, filter_param, output_path, flip_choice, encode_flags,
+                          metadata_only=False):
         self.progress.emit(f"Flipping video ({flip_choice}): {file_path}")
-        cmd = [ffmpeg_path, "-i", file_path, "-vf", filter_param, "-c:a", "copy", output_path]
+        
+        source_rotation = probe_rotation(file_path) if metadata_only and not os.path.exists(output_path) else None
+        if source_rotation is not None:
+            # Stream-copy with 180° (hflip+vflip) added to the source's display
+            # rotation; -display_rotation needs ffmpeg 6+, older builds turn the
+            # (clockwise) rotate tag into the display matrix when muxing. Newer
+            # muxers ignore that tag, so each attempt only counts if the output
+            # really carries the new rotation.
+            rotation = (source_rotation + 180) % 360
+            for cmd in (
+                [ffmpeg_path, *FFMPEG_QUIET, "-display_rotation:v:0", str(rotation), "-i", file_path, "-c", "copy", output_path],
+                [ffmpeg_path, *FFMPEG_QUIET, "-i", file_path, "-c", "copy", "-metadata:s:v:0", f"rotate={-rotation % 360}", output_path],
+            ):
+                self.progress.emit(f"Running command: {' '.join(cmd)}")
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                if result.returncode == 0 and probe_rotation(output_path) == rotation:
+                    self.finished.emit(True, f"Flip completed (rotation tag only)! Saved to: {output_path}")
+                    return
+                # Drop any partial or unrotated output so the next attempt can write it
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+            self.progress.emit("Rotation tag not supported for this file, re-encoding instead...")
+        
+        cmd = [ffmpeg_path, "-i", file_path, "-vf", filter_param, *encode_flags, "-c:a", "copy", output_path]
         self.progress.emit(f"Running command: {' '.join(cmd)}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg_with_progress(cmd)
         if result.returncode == 0:
             self.finished.emit(True, f"Flip completed! Saved to: {output_path}")
         else:
             self.finished.emit(False, f"Flip failed: {result.stderr}")
     
-    def flip_folder_worker(self, ffmpeg_path, video_files, filter_param, output_folder, suffix):
-        successful_flips = 0
-        failed_flips = 0
+    def _run_ffmpeg_with_progress(self, cmd):
+        """Run a single-file ffmpeg encode, logging its position as it goes.
+
+        ffmpeg writes key=value progress blocks to stdout (-progress pipe:1);
+        anything else on the merged stream is an error message. Returns a
+        CompletedProcess whose stderr holds those messages.
+        """
+        cmd = [cmd[0], *FFMPEG_QUIET, "-progress", "pipe:1", *cmd[1:]]
+        errors = []
+        out_time = speed = None
+        last_report = time.monotonic()
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as proc:
+            for line in proc.stdout:
+                key, sep, value = line.rstrip().partition(b"=")
+                if not (sep and key.replace(b"_", b"").isalnum()):
+                    errors.append(line.decode(errors="replace"))
+                elif key == b"out_time":
+                    out_time = value
+                elif key == b"speed":
+                    speed = value
+                elif key == b"progress" and out_time:
+                    now = time.monotonic()
+                    if now - last_report >= PROGRESS_INTERVAL:
+                        last_report = now
+                        self.progress.emit(f"Encoded up to {out_time.decode().split('.')[0]} ({speed.decode().strip() if speed else '?'})")
+        return subprocess.CompletedProcess(cmd, proc.returncode, stderr="".join(errors))
+    
+    def _run_folder_jobs(self, job, video_files, jobs):
+        """Run job(index, file_path) -> bool for every file on up to `jobs`
+        threads, each blocking on its own ffmpeg process; returns (successful, failed)"""
+        def prefetch_and_run(i, file_path):
+            # Warm the page cache for the file that starts once this batch is done
+            if i + jobs < len(video_files):
+                advise_file(video_files[i + jobs], "POSIX_FADV_WILLNEED", PREFETCH_BYTES)
+            try:
+                return job(i, file_path)
+            finally:
+                # Each input is read once; evict it so a large batch does not
+                # push everything else out of the page cache
+                advise_file(file_path, "POSIX_FADV_DONTNEED")
+        
+        successful = self._map_jobs(prefetch_and_run, jobs, range(len(video_files)), video_files)
+        return successful, len(video_files) - successful
+    
+    def _map_jobs(self, job, jobs, *iterables):
+        """Map job over iterables on up to `jobs` pool threads that launch their
+        ffmpeg through _run_job_ffmpeg; returns how many calls returned True"""
+        # Size everything by the pool actually started, not the configured job
+        # count: two tasks on a many-core box get half the cores each
+        jobs = max(1, min(jobs, min(map(len, iterables))))
+        # The argv pieces that are the same for every call are built once here:
+        # the shared ffmpeg options, and each pool thread's launcher prefix
+        threads = str(max(1, (os.cpu_count() or 1) // jobs))
+        # The encode flags already split the encoder threads across jobs; cap
+        # the decoder and filter graph threads to the same share
+        self._job_options = [*FFMPEG_QUIET, "-filter_threads", threads, "-threads", threads]
+        cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+        per_job = len(cores) // jobs
+        
+        # Each pool thread owns one slot (a disjoint share of the cores) for its jobs
+        slots = count()
+        self._job_slot = threading.local()
+        
+        def claim_slot():
+            launcher = [_NICE, "-n", "10"] if _NICE else []
+            if _TASKSET and jobs > 1 and per_job:
+                first = next(slots) * per_job
+                launcher += [_TASKSET, "-c", ",".join(map(str, cores[first:first + per_job]))]
+            self._job_slot.launcher = launcher
+        
+        with ThreadPoolExecutor(max_workers=jobs, initializer=claim_slot) as pool:
+            return sum(pool.map(job, *iterables))
+    
+    def _run_job_ffmpeg(self, cmd):
+        """Run a folder job's ffmpeg below normal priority so the GUI stays responsive,
+        pinned on Linux to the calling pool thread's share of the cores. Parallel
+        ffmpegs must not share the app's stdin: they would fight over the terminal
+        (raw mode, SIGTTIN when backgrounded) and hang on the overwrite prompt"""
+        cmd = [cmd[0], "-nostdin", *self._job_options, *cmd[1:]]
+        if os.name == "nt":
+            return subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True,
+                                  creationflags=subprocess.BELOW_NORMAL_PRIORITY_CLASS)
+        return subprocess.run(self._job_slot.launcher + cmd, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+    
+    def flip_folder_worker(self, ffmpeg_path, video_files, folder_path, filter_param, output_folder, suffix, encode_flags, jobs=FOLDER_JOBS):
         total_files = len(video_files)
         
-        for i, file_path in enumerate(video_files):
+        def flip_file(i, file_path):
             filename = os.path.basename(file_path)
             name, ext = os.path.splitext(filename)
-            output_path = os.path.join(output_folder, f"{name}{suffix}{ext}")
+            # Files from a recursive scan keep their subfolder, so sub/x.mp4 and
+            # sub2/x.mp4 do not both write to the same output file
+            file_output_folder = os.path.normpath(os.path.join(
+                output_folder, os.path.relpath(os.path.dirname(file_path), folder_path)))
+            os.makedirs(file_output_folder, exist_ok=True)
+            output_path = os.path.join(file_output_folder, f"{name}{suffix}{ext}")
             
             self.progress.emit(f"[{i+1}/{total_files}] Flipping: {filename}")
             
-            cmd = [ffmpeg_path, "-i", file_path, "-vf", filter_param, "-c:a", "copy", output_path]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            cmd = [ffmpeg_path, "-i", file_path, "-vf", filter_param, *encode_flags, "-c:a", "copy", output_path]
+            result = self._run_job_ffmpeg(cmd)
             
             if result.returncode == 0:
                 self.progress.emit(f"✓ Successfully flipped: {filename}")
-                successful_flips += 1
-            else:
-                self.progress.emit(f"✗ Failed to flip {filename}: {result.stderr}")
-                failed_flips += 1
+                return True
+            self.progress.emit(f"✗ Failed to flip {filename}: {result.stderr}")
+            return False
         
+        successful_flips, failed_flips = self._run_folder_jobs(flip_file, video_files, jobs)
         self.finished.emit(True, f"Folder flip completed! Success: {successful_flips}, Failed: {failed_flips}")
     
-    def split_video_worker(self, ffmpeg_path, file_path, segment_time, output_pattern):
+    def split_video_worker(self, ffmpeg_path, file_path, segment_time, output_pattern, stream_copy=False):
         self.progress.emit(f"Splitting video into {segment_time//60} minute parts...")
         
-        # Use proper segmenting command that re-encodes to ensure clean splits
+        if stream_copy:
+            # Remux only: no decode/encode, but cuts land on the next keyframe
+            codec_args = ["-c", "copy"]
+        else:
+            # Re-encode so every part starts exactly on its cut point
+            codec_args = ["-c:v", "libx264", "-c:a", "aac"]
+        
         cmd = [
-            ffmpeg_path, 
+            ffmpeg_path, *FFMPEG_QUIET,
             "-i", file_path,
-            "-c:v", "libx264",  # Re-encode video for clean splits
-            "-c:a", "aac",      # Re-encode audio for compatibility
+            *codec_args,
             "-map", "0",
             "-f", "segment",
             "-segment_time", str(segment_time),
@@ -107,30 +322,88 @@ class WorkerThread(QThread):
         else:
             self.finished.emit(False, f"Split failed: {result.stderr}")
     
-    def convert_to_reel_worker(self, ffmpeg_path, video_files, folder_path):
-        successful_conversions = 0
-        failed_conversions = 0
+    def split_parallel_worker(self, ffmpeg_path, file_path, segment_time, output_pattern, total_parts, encode_flags, jobs=FOLDER_JOBS):
+        """Exact split with the parts encoded side by side, each ffmpeg seeking
+        to its own cut point; total_parts comes from the caller's probe, and
+        without it (duration unknown) one segmenting ffmpeg does the split"""
+        if not total_parts:
+            self.progress.emit("Could not read the video duration, splitting in a single pass")
+            self.split_video_worker(ffmpeg_path, file_path, segment_time, output_pattern)
+            return
+        
+        self.progress.emit(f"Splitting video into {total_parts} parts of {segment_time//60} minutes, {min(jobs, total_parts)} at a time...")
+        
+        # All parts read the same input, so there is no per-file prefetch or eviction here
+        def encode_part(index):
+            start = index * segment_time
+            cmd = [
+                ffmpeg_path,
+                "-ss", str(start),  # Input seek: decoding starts near the cut, output starts exactly on it
+                "-i", file_path,
+                "-t", str(segment_time),
+                *encode_flags,
+                "-c:a", "aac",
+                "-map", "0",
+                "-avoid_negative_ts", "make_zero",
+                "-y", output_pattern % index
+            ]
+            result = self._run_job_ffmpeg(cmd)
+            if result.returncode == 0:
+                self.progress.emit(f"✓ Part {index+1}/{total_parts} done")
+                return True
+            self.progress.emit(f"✗ Part {index+1}/{total_parts} failed: {result.stderr}")
+            return False
+        
+        successful = self._map_jobs(encode_part, jobs, range(total_parts))
+        
+        if successful == total_parts:
+            self.finished.emit(True, f"Split completed successfully! Created {total_parts} parts.")
+        else:
+            self.finished.emit(False, f"Split failed for {total_parts - successful} of {total_parts} parts.")
+    
+    def convert_to_reel_worker(self, ffmpeg_path, video_files, encode_flags, jobs=FOLDER_JOBS):
         total_files = len(video_files)
         
-        for file_idx, video_file in enumerate(video_files):
+        def convert_file(file_idx, video_file):
             filename = os.path.basename(video_file)
             base_name = os.path.splitext(filename)[0]
             
-            output_folder = os.path.join(folder_path, f"{base_name}_converted")
+            # Next to the source, so same-named files in different subfolders stay apart
+            output_folder = os.path.join(os.path.dirname(video_file), f"{base_name}_converted")
             os.makedirs(output_folder, exist_ok=True)
             
             self.progress.emit(f"[{file_idx+1}/{total_files}] Converting: {filename}")
             
-            # Get video duration
+            # Get video duration, plus the video stream's size and codec in the same probe
             try:
-                duration_cmd = ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", video_file]
-                duration_result = subprocess.run(duration_cmd, capture_output=True, text=True, check=True)
-                duration = int(float(duration_result.stdout.strip()))
+                probe_cmd = ["ffprobe", "-v", "error", "-select_streams", "v:0",
+                             "-show_entries", "stream=codec_name,width,height:format=duration",
+                             "-of", "default=noprint_wrappers=1", video_file]
+                probe_result = subprocess.run(probe_cmd, capture_output=True, text=True, check=True)
+                info = dict(line.split("=", 1) for line in probe_result.stdout.splitlines() if "=" in line)
+                duration = int(float(info["duration"]))
                 self.progress.emit(f"Video duration: {duration} seconds")
-            except subprocess.CalledProcessError as e:
+            except (subprocess.CalledProcessError, KeyError, ValueError) as e:
                 self.progress.emit(f"✗ Failed to get duration for {filename}: {e}")
-                failed_conversions += 1
-                continue
+                return False
+            
+            # An H.264 video already at 1080x1920 comes out of the filter graph unchanged,
+            # so its parts are remuxed; stream-copied parts start on the keyframe at or
+            # before each cut. A display rotation means the coded size is not what is
+            # shown (or what the filter graph sees), so rotated files are re-encoded.
+            remux = (info.get("codec_name") == "h264" and (info.get("width"), info.get("height")) == ("1080", "1920")
+                     and probe_rotation(video_file) == 0)
+            if remux:
+                self.progress.emit("Already 1080x1920 H.264, copying streams instead of re-encoding")
+                video_args = ["-c", "copy"]
+            else:
+                video_args = [
+                    "-filter_complex",
+                    "[0:v]scale=1080:1920:force_original_aspect_ratio=increase,boxblur=10:1[bg];"
+                    "[0:v]scale=1080:1920:force_original_aspect_ratio=decrease[fg];"
+                    "[bg][fg]overlay=(W-w)/2:(H-h)/2,crop=1080:1920",
+                    *encode_flags, "-c:a", "copy",
+                ]
 
             start = 0
             count = 0
@@ -144,34 +417,77 @@ class WorkerThread(QThread):
 
                 cmd = [
                     ffmpeg_path, "-ss", str(start), "-i", video_file, "-t", str(chunk),
-                    "-filter_complex",
-                    "[0:v]scale=1080:1920:force_original_aspect_ratio=increase,boxblur=10:1[bg];"
-                    "[0:v]scale=1080:1920:force_original_aspect_ratio=decrease[fg];"
-                    "[bg][fg]overlay=(W-w)/2:(H-h)/2,crop=1080:1920",
-                    "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                    *video_args,
                     output_path
                 ]
 
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                result = self._run_job_ffmpeg(cmd)
                 if result.returncode == 0:
                     self.progress.emit(f"✓ Successfully created part {count+1}")
                 else:
                     self.progress.emit(f"✗ Failed to create part {count+1}: {result.stderr}")
-                    failed_conversions += 1
-                    break
+                    return False
 
                 start += 600
                 count += 1
 
-            if start >= duration:
-                self.progress.emit(f"✅ Done: {base_name} → Folder: {output_folder}")
-                successful_conversions += 1
-            else:
-                failed_conversions += 1
+            self.progress.emit(f"✅ Done: {base_name} → Folder: {output_folder}")
+            return True
 
+        successful_conversions, failed_conversions = self._run_folder_jobs(convert_file, video_files, jobs)
         self.finished.emit(True, f"Conversion completed! Success: {successful_conversions}, Failed: {failed_conversions}")
     
-    def remove_logo_worker(self, ffmpeg_path, file_path, method_type, logo_position, output_path):
+    def multi_delogo_worker(self, ffmpeg_path, file_path, logo_positions, output_path, encode_flags=LOGO_ENCODE_FLAGS):
+        """Remove several logos in one encode by chaining a delogo filter per area"""
+        self.progress.emit(f"Removing {len(logo_positions)} logos with a delogo chain...")
+        
+        probe_cmd = [
+            "ffprobe", "-v", "error", "-select_streams", "v:0", 
+            "-show_entries", "stream=width,height", "-of", "csv=p=0", file_path
+        ]
+        try:
+            probe_result = subprocess.run(probe_cmd, capture_output=True, text=True)
+            video_width, video_height = map(int, probe_result.stdout.strip().split(',')[:2])
+        except (OSError, ValueError):
+            video_width, video_height = 1920, 1080
+            self.progress.emit("Warning: Could not detect video dimensions, using fallback 1920x1080")
+        
+        filters = []
+        padding = 5
+        for logo_position in logo_positions:
+            # Same padding and clamping as remove_logo_worker: delogo needs the
+            # area strictly inside the frame
+            x = max(0, logo_position["x"] - padding)
+            y = max(0, logo_position["y"] - padding)
+            if x >= video_width or y >= video_height:
+                self.progress.emit(f"Skipping logo at ({x}, {y}): outside the {video_width}x{video_height} frame")
+                continue
+            w = min(logo_position["width"] + 2 * padding, video_width - x - 1)
+            h = min(logo_position["height"] + 2 * padding, video_height - y - 1)
+            if w < 2 or h < 2:
+                self.progress.emit(f"Skipping logo at ({x}, {y}): area too small after validation ({w}x{h})")
+                continue
+            filters.append(f"delogo=x={x}:y={y}:w={w}:h={h}:show=0")
+        
+        if not filters:
+            self.finished.emit(False, "Error: No logo area fits inside the video frame")
+            return
+        
+        cmd = [
+            ffmpeg_path, "-i", file_path,
+            "-vf", ",".join(filters),
+            *encode_flags, "-c:a", "copy",
+            output_path
+        ]
+        self.progress.emit(f"Running command: {' '.join(cmd)}")
+        
+        result = self._run_ffmpeg_with_progress(cmd)
+        if result.returncode == 0:
+            self.finished.emit(True, f"Removed {len(filters)} logos! Saved to: {output_path}")
+        else:
+            self.finished.emit(False, f"Logo removal failed: {result.stderr}")
+    
+    def remove_logo_worker(self, ffmpeg_path, file_path, method_type, logo_position, output_path, encode_flags=LOGO_ENCODE_FLAGS):
         self.progress.emit(f"Removing logo using {method_type} method...")
         
         # Get video dimensions first for coordinate validation
@@ -244,7 +560,7 @@ class WorkerThread(QThread):
                 ffmpeg_path, "-i", file_path,
                 "-filter_complex", filter_complex,
                 "-map", "[out]", "-map", "0:a?",
-                "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                *encode_flags, "-c:a", "copy",
                 output_path
             ]
         elif method_type == "blackout":
@@ -253,7 +569,7 @@ class WorkerThread(QThread):
             cmd = [
                 ffmpeg_path, "-i", file_path,
                 "-vf", vf_filter,
-                "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                *encode_flags, "-c:a", "copy",
                 output_path
             ]
         elif method_type == "pixelate":
@@ -264,7 +580,7 @@ class WorkerThread(QThread):
                 ffmpeg_path, "-i", file_path,
                 "-filter_complex", filter_complex,
                 "-map", "[out]", "-map", "0:a?",
-                "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                *encode_flags, "-c:a", "copy",
                 output_path
             ]
         elif method_type == "inpaint":
@@ -286,7 +602,7 @@ class WorkerThread(QThread):
                 ffmpeg_path, "-i", file_path,
                 "-filter_complex", filter_complex,
                 "-map", "[out]", "-map", "0:a?",
-                "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                *encode_flags, "-c:a", "copy",
                 output_path
             ]
         elif method_type == "lama":
@@ -345,7 +661,7 @@ class WorkerThread(QThread):
                         ffmpeg_path, "-i", file_path,
                         "-filter_complex", filter_complex,
                         "-map", "[out]", "-map", "0:a?",
-                        "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                        *encode_flags, "-c:a", "copy",
                         output_path
                     ]
                 else:
@@ -358,7 +674,7 @@ class WorkerThread(QThread):
                         ffmpeg_path, "-i", file_path,
                         "-filter_complex", filter_complex,
                         "-map", "[out]", "-map", "0:a?",
-                        "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                        *encode_flags, "-c:a", "copy",
                         output_path
                     ]
                 
@@ -376,7 +692,7 @@ class WorkerThread(QThread):
                     ffmpeg_path, "-i", file_path,
                     "-filter_complex", filter_complex,
                     "-map", "[out]", "-map", "0:a?",
-                    "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                    *encode_flags, "-c:a", "copy",
                     output_path
                 ]
             except Exception as e:
@@ -386,7 +702,7 @@ class WorkerThread(QThread):
                     ffmpeg_path, "-i", file_path,
                     "-filter_complex", filter_complex,
                     "-map", "[out]", "-map", "0:a?",
-                    "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                    *encode_flags, "-c:a", "copy",
                     output_path
                 ]
         else:  # delogo
@@ -395,13 +711,13 @@ class WorkerThread(QThread):
             cmd = [
                 ffmpeg_path, "-i", file_path,
                 "-vf", vf_filter,
-                "-c:v", "libx264", "-crf", "23", "-preset", "medium", "-c:a", "copy",
+                *encode_flags, "-c:a", "copy",
                 output_path
             ]
         
         self.progress.emit(f"Running command: {' '.join(cmd)}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg_with_progress(cmd)
         if result.returncode == 0:
             self.finished.emit(True, f"Logo removal completed! Saved to: {output_path}")
         else:
@@ -413,7 +729,7 @@ class WorkerThread(QThread):
         self.progress.emit(f"Command: {' '.join(cmd)}")
         
         # Run the dynamic command
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self._run_ffmpeg_with_progress(cmd)
         
         if result.returncode == 0:
             self.finished.emit(True, f"Dynamic removal completed! Saved to: {output_path}")